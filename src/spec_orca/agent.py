@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Sequence
 
-from spec_orca.backend import Backend
-from spec_orca.models import Context, Result, Spec
+from spec_orca.backend import AsyncBackend, Backend
+from spec_orca.models import Context, Result, ResultStatus, Spec
 
-__all__ = ["Agent"]
+__all__ = ["Agent", "error_result"]
 
 
 class Agent:
@@ -15,6 +16,9 @@ class Agent:
 
     def __init__(self, backend: Backend) -> None:
         self._backend = backend
+        # Protocol isinstance checks inspect every protocol member, so the
+        # async capability is probed once here rather than per spec.
+        self._async_backend = backend if isinstance(backend, AsyncBackend) else None
 
     def select_next_spec(self, specs: Sequence[Spec]) -> Spec | None:
         if not specs:
@@ -29,3 +33,37 @@ class Agent:
         if spec is None:
             return None
         return spec, self.execute(spec, context)
+
+    async def run_batch(self, specs: Sequence[Spec], context: Context) -> list[Result]:
+        """Execute independent specs concurrently.
+
+        Results are returned in the same order as ``specs``. Backends that
+        implement ``AsyncBackend`` are awaited directly; synchronous backends
+        run in worker threads. An exception raised for one spec is reported as
+        an error ``Result`` rather than cancelling the rest of the batch.
+        """
+        tasks = [asyncio.create_task(self._execute_async(spec, context)) for spec in specs]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        results: list[Result] = []
+        for outcome in outcomes:
+            if isinstance(outcome, Result):
+                results.append(outcome)
+            elif isinstance(outcome, Exception):
+                results.append(error_result(outcome))
+            else:
+                raise outcome
+        return results
+
+    async def _execute_async(self, spec: Spec, context: Context) -> Result:
+        if self._async_backend is not None:
+            return await self._async_backend.execute_async(spec, context)
+        return await asyncio.to_thread(self._backend.execute, spec, context)
+
+
+def error_result(exc: Exception) -> Result:
+    """Report an exception raised by a backend as an error ``Result``."""
+    return Result(
+        status=ResultStatus.ERROR,
+        summary=f"Backend raised {type(exc).__name__}",
+        error=str(exc) or type(exc).__name__,
+    )
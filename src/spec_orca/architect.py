@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
+from array import array
+from collections.abc import Callable
 from dataclasses import replace
 from pathlib import Path
 
@@ -20,19 +23,47 @@ class SimpleArchitect:
         self._specs = _order_specs(specs)
         self._index = {spec.id: idx for idx, spec in enumerate(self._specs)}
         self._max_attempts = max_attempts
+        self._specs_snapshot: tuple[Spec, ...] | None = None
+        # Reverse dependency edges and per-spec counts of dependencies that
+        # are not yet DONE, keyed by plan index and maintained incrementally
+        # by record_result().
+        count = len(self._specs)
+        self._dependents: list[list[int]] = [[] for _ in range(count)]
+        self._pending_deps = array("i", [0]) * count
+        for idx, spec in enumerate(self._specs):
+            for dep in spec.dependencies:
+                dep_index = self._index.get(dep)
+                if dep_index is None:
+                    self._pending_deps[idx] += 1
+                    continue
+                self._dependents[dep_index].append(idx)
+                if self._specs[dep_index].status != SpecStatus.DONE:
+                    self._pending_deps[idx] += 1
+        # Indices of specs whose dependencies are all satisfied and that are
+        # not DONE.
+        self._ready: set[int] = {
+            idx
+            for idx, spec in enumerate(self._specs)
+            if self._pending_deps[idx] == 0 and spec.status != SpecStatus.DONE
+        }
 
     @property
-    def specs(self) -> list[Spec]:
-        return list(self._specs)
+    def specs(self) -> tuple[Spec, ...]:
+        """Immutable snapshot of all specs in plan order.
+
+        The tuple is cached and only rebuilt after a spec changes, so repeated
+        reads between updates do not copy.
+        """
+        if self._specs_snapshot is None:
+            self._specs_snapshot = tuple(self._specs)
+        return self._specs_snapshot
 
     def runnable_specs(self) -> list[Spec]:
         runnable: list[Spec] = []
-        for spec in self._specs:
-            if not _can_attempt(spec, self._max_attempts):
-                continue
-            if not _dependencies_satisfied(spec, self._index, self._specs):
-                continue
-            runnable.append(spec)
+        for idx in sorted(self._ready):
+            spec = self._specs[idx]
+            if _can_attempt(spec, self._max_attempts):
+                runnable.append(spec)
         return runnable
 
     def mark_in_progress(self, spec_id: str) -> Spec:
@@ -40,18 +71,33 @@ class SimpleArchitect:
         if not _can_attempt(spec, self._max_attempts):
             msg = f"Spec '{spec_id}' is not eligible to run"
             raise ValueError(msg)
-        if not _dependencies_satisfied(spec, self._index, self._specs):
+        if self._pending_deps[self._index[spec_id]]:
             msg = f"Dependencies not satisfied for spec '{spec_id}'"
             raise ValueError(msg)
-        updated = replace(spec, status=SpecStatus.IN_PROGRESS)
+        updated = _with_status(spec, SpecStatus.IN_PROGRESS, spec.attempts)
         self._replace_spec(updated)
         return updated
 
     def record_result(self, spec_id: str, result: Result) -> Spec:
         spec = self._get_spec(spec_id)
         status = _status_from_result(result)
-        updated = replace(spec, status=status, attempts=spec.attempts + 1)
+        updated = _with_status(spec, status, spec.attempts + 1)
         self._replace_spec(updated)
+        idx = self._index[spec_id]
+        if status == SpecStatus.DONE and spec.status != SpecStatus.DONE:
+            self._ready.discard(idx)
+            for child in self._dependents[idx]:
+                self._pending_deps[child] -= 1
+                if self._pending_deps[child] == 0:
+                    self._ready.add(child)
+        elif spec.status == SpecStatus.DONE and status != SpecStatus.DONE:
+            # A finished spec was re-reported as failed: its dependents are
+            # blocked again and the spec itself may be retried.
+            for child in self._dependents[idx]:
+                self._pending_deps[child] += 1
+                self._ready.discard(child)
+            if self._pending_deps[idx] == 0:
+                self._ready.add(idx)
         return updated
 
     def _get_spec(self, spec_id: str) -> Spec:
@@ -62,71 +108,92 @@ class SimpleArchitect:
 
     def _replace_spec(self, updated: Spec) -> None:
         self._specs[self._index[updated.id]] = updated
+        self._specs_snapshot = None
 
 
 def _order_specs(specs: list[Spec]) -> list[Spec]:
     if not specs:
         return []
     index_by_id = {spec.id: idx for idx, spec in enumerate(specs)}
-    graph: dict[str, list[str]] = {spec.id: [] for spec in specs}
-    indegree: dict[str, int] = {spec.id: 0 for spec in specs}
-    for spec in specs:
+    if _is_topologically_ordered(specs, index_by_id):
+        # Every dependency already precedes its dependents, so the
+        # index-ordered topological sort below would return the input as is.
+        return list(specs)
+
+    # Compressed sparse row adjacency over spec indices: the dependents of
+    # spec ``i`` are ``edges[edge_start[i]:edge_start[i + 1]]``.
+    count = len(specs)
+    indegree = array("i", [0]) * count
+    edge_start = array("i", [0]) * (count + 1)
+    for idx, spec in enumerate(specs):
         for dep in spec.dependencies:
-            graph.setdefault(dep, []).append(spec.id)
-            indegree[spec.id] = indegree.get(spec.id, 0) + 1
-
-    import heapq
-
-    heap: list[tuple[int, str]] = []
-    for spec in specs:
-        if indegree.get(spec.id, 0) == 0:
-            heapq.heappush(heap, (index_by_id[spec.id], spec.id))
-
-    ordered_ids: list[str] = []
+            # Unknown dependencies still count toward indegree so the spec
+            # can never become ready and is reported as part of a cycle.
+            indegree[idx] += 1
+            dep_index = index_by_id.get(dep)
+            if dep_index is not None:
+                edge_start[dep_index + 1] += 1
+    for idx in range(count):
+        edge_start[idx + 1] += edge_start[idx]
+    edges = array("i", [0]) * edge_start[count]
+    fill = edge_start[:count]
+    for idx, spec in enumerate(specs):
+        for dep in spec.dependencies:
+            dep_index = index_by_id.get(dep)
+            if dep_index is not None:
+                edges[fill[dep_index]] = idx
+                fill[dep_index] += 1
+
+    # Always emit the lowest-index ready spec so the plan stays as close to
+    # the file order as the dependencies allow.
+    heap = [idx for idx in range(count) if indegree[idx] == 0]
+    order = array("i", [0]) * count
+    processed = 0
     while heap:
-        _, spec_id = heapq.heappop(heap)
-        ordered_ids.append(spec_id)
-        for child in graph.get(spec_id, []):
+        idx = heapq.heappop(heap)
+        order[processed] = idx
+        processed += 1
+        for child in edges[edge_start[idx] : edge_start[idx + 1]]:
             indegree[child] -= 1
             if indegree[child] == 0:
-                heapq.heappush(heap, (index_by_id.get(child, 0), child))
+                heapq.heappush(heap, child)
 
-    if len(ordered_ids) != len(specs):
+    if processed != count:
         msg = "Circular dependencies detected in spec graph"
         raise ValueError(msg)
 
-    id_to_spec = {spec.id: spec for spec in specs}
-    return [id_to_spec[spec_id] for spec_id in ordered_ids]
-
-
-def _dependencies_satisfied(
-    spec: Spec,
-    index: dict[str, int],
-    specs: list[Spec],
-) -> bool:
-    for dep in spec.dependencies:
-        dep_index = index.get(dep)
-        if dep_index is None:
-            return False
-        dep_spec = specs[dep_index]
-        if dep_spec.status != SpecStatus.DONE:
-            return False
+    return [specs[idx] for idx in order]
+
+
+def _is_topologically_ordered(specs: list[Spec], index_by_id: dict[str, int]) -> bool:
+    for idx, spec in enumerate(specs):
+        for dep in spec.dependencies:
+            dep_index = index_by_id.get(dep)
+            if dep_index is None or dep_index >= idx:
+                return False
     return True
 
 
+def _with_status(spec: Spec, status: SpecStatus, attempts: int) -> Spec:
+    return replace(spec, status=status, attempts=attempts)
+
+
+_CAN_ATTEMPT: dict[SpecStatus, Callable[[Spec, int], bool]] = {
+    SpecStatus.PENDING: lambda spec, max_attempts: True,
+    SpecStatus.IN_PROGRESS: lambda spec, max_attempts: False,
+    SpecStatus.DONE: lambda spec, max_attempts: False,
+    SpecStatus.FAILED: lambda spec, max_attempts: spec.attempts < max_attempts,
+}
+
+_STATUS_FROM_RESULT: dict[ResultStatus, SpecStatus] = {
+    ResultStatus.SUCCESS: SpecStatus.DONE,
+}
+
+
 def _can_attempt(spec: Spec, max_attempts: int) -> bool:
-    if spec.status == SpecStatus.DONE:
-        return False
-    if spec.status == SpecStatus.IN_PROGRESS:
-        return False
-    if spec.status == SpecStatus.PENDING:
-        return True
-    if spec.status == SpecStatus.FAILED:
-        return spec.attempts < max_attempts
-    return False
+    check = _CAN_ATTEMPT.get(spec.status)
+    return check is not None and check(spec, max_attempts)
 
 
 def _status_from_result(result: Result) -> SpecStatus:
-    if result.status == ResultStatus.SUCCESS:
-        return SpecStatus.DONE
-    return SpecStatus.FAILED
+    return _STATUS_FROM_RESULT.get(result.status, SpecStatus.FAILED)
@@ -7,13 +7,17 @@ from typing import Protocol, runtime_checkable
 
 from spec_orca.models import Context, Result, Spec
 
-__all__ = ["Backend"]
+__all__ = ["AsyncBackend", "Backend"]
 
 
 @runtime_checkable
 class Backend(Protocol):
     """Executable backend that can run a spec in a given context."""
 
+    # Empty so that implementations subclassing the protocol can use
+    # ``__slots__`` without inheriting an instance ``__dict__``.
+    __slots__ = ()
+
     def execute(self, spec: Spec, context: Context) -> Result:
         """Execute a spec and return the result."""
         ...
@@ -25,3 +29,16 @@ class Backend(Protocol):
         and spec-implementation framing.
         """
         ...
+
+
+@runtime_checkable
+class AsyncBackend(Protocol):
+    """Backend that can execute a spec without blocking the event loop.
+
+    Implementing this alongside ``Backend`` lets ``Agent.run_batch`` overlap
+    many backend invocations on a single event loop.
+    """
+
+    async def execute_async(self, spec: Spec, context: Context) -> Result:
+        """Execute a spec asynchronously and return the result."""
+        ...
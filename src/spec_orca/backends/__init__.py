@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
-from spec_orca.backends.claude import ClaudeCodeBackend, ClaudeCodeConfig
-from spec_orca.backends.codex import CodexBackend, CodexConfig
-from spec_orca.backends.mock import MockBackend, MockBackendConfig
+import importlib
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from spec_orca.backends.claude import ClaudeCodeBackend, ClaudeCodeConfig
+    from spec_orca.backends.codex import CodexBackend, CodexConfig
+    from spec_orca.backends.mock import MockBackend, MockBackendConfig
+
+    ClaudeBackend = ClaudeCodeBackend
 
 __all__ = [
     "ClaudeBackend",
@@ -18,22 +25,44 @@ __all__ = [
     "resolve_backend_name",
 ]
 
-_BACKEND_NAMES = ("claude", "codex", "mock")
+# Ordered for error messages; the frozenset serves membership checks.
+_BACKEND_NAMES: tuple[str, ...] = ("claude", "codex", "mock")
+_BACKEND_NAMES_SET: frozenset[str] = frozenset(_BACKEND_NAMES)
 
 _ENV_VAR = "SPEC_ORCA_BACKEND"
 _DEFAULT_BACKEND = "mock"
 
-# Backwards-compatible alias.
-ClaudeBackend = ClaudeCodeBackend
+# Backend classes are imported on first access so that callers which only
+# need resolve_backend_name() (e.g. ``spec-orca doctor``) skip loading the
+# subprocess/asyncio machinery. ``ClaudeBackend`` is a backwards-compatible
+# alias for ``ClaudeCodeBackend``.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "ClaudeBackend": ("spec_orca.backends.claude", "ClaudeCodeBackend"),
+    "ClaudeCodeBackend": ("spec_orca.backends.claude", "ClaudeCodeBackend"),
+    "ClaudeCodeConfig": ("spec_orca.backends.claude", "ClaudeCodeConfig"),
+    "CodexBackend": ("spec_orca.backends.codex", "CodexBackend"),
+    "CodexConfig": ("spec_orca.backends.codex", "CodexConfig"),
+    "MockBackend": ("spec_orca.backends.mock", "MockBackend"),
+    "MockBackendConfig": ("spec_orca.backends.mock", "MockBackendConfig"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
 
 
 def resolve_backend_name(cli_value: str | None = None) -> str:
     """Return the effective backend name after applying precedence rules."""
-    import os
-
     name = cli_value or os.environ.get(_ENV_VAR) or _DEFAULT_BACKEND
     name = name.strip().lower()
-    if name not in _BACKEND_NAMES:
+    if name not in _BACKEND_NAMES_SET:
         msg = f"Unknown backend '{name}'. Available backends: {', '.join(_BACKEND_NAMES)}"
         raise ValueError(msg)
     return name
@@ -50,11 +79,17 @@ def create_backend(
 ) -> MockBackend | ClaudeCodeBackend | CodexBackend:
     """Instantiate a backend by its registered name."""
     if name == "mock":
+        from spec_orca.backends.mock import MockBackend
+
         return MockBackend(config=mock_config)
     if name == "claude":
+        from spec_orca.backends.claude import ClaudeCodeBackend, ClaudeCodeConfig
+
         claude_backend_config = claude_config or ClaudeCodeConfig(executable=claude_executable)
         return ClaudeCodeBackend(config=claude_backend_config)
     if name == "codex":
+        from spec_orca.backends.codex import CodexBackend, CodexConfig
+
         codex_backend_config = codex_config or CodexConfig(executable=codex_executable)
         return CodexBackend(config=codex_backend_config)
     msg = f"Unknown backend: {name}"
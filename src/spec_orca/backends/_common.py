@@ -0,0 +1,162 @@
+"""Helpers shared by the CLI-backed backend implementations."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import shutil
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from typing import Any, TypeGuard, cast
+
+from spec_orca.git_ops import GitStatusDelta, compute_status_delta
+from spec_orca.models import Context
+
+__all__ = [
+    "ExecutableLookup",
+    "communicate_async",
+    "decode_output",
+    "files_changed_since",
+    "is_str_list",
+    "json_loads",
+    "merge_details_and_notes",
+    "parse_json_output",
+    "read_env_snapshot",
+    "status_snapshot",
+]
+
+
+# orjson is an optional speedup for parsing the (potentially multi-MB) CLI
+# output; fall back to the stdlib when it is not installed.
+json_loads: Callable[[str | bytes], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on the environment
+    json_loads = json.loads
+
+
+class ExecutableLookup:
+    """Locate a backend CLI on ``PATH``, remembering where it was found."""
+
+    __slots__ = ("_name", "_path")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._path: str | None = None
+
+    def resolve(self) -> str | None:
+        # Only successful lookups are cached so a CLI installed mid-session
+        # is still picked up on the next call.
+        if self._path is None:
+            self._path = shutil.which(self._name)
+        return self._path
+
+
+async def communicate_async(
+    cmd: Sequence[str], *, cwd: Path, timeout: float
+) -> tuple[int, bytes, bytes] | None:
+    """Run ``cmd`` without blocking the event loop and capture its output.
+
+    Returns ``(returncode, stdout, stderr)``, or None when ``timeout``
+    expires. A child that is still running on the way out is killed, whether
+    the call timed out or the awaiting task was cancelled, so it never
+    outlives the call.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    except TimeoutError:
+        return None
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    # communicate() only returns once the child has exited.
+    return cast(int, proc.returncode), stdout, stderr
+
+
+def status_snapshot(context: Context) -> tuple[GitStatusDelta, str | None]:
+    """Take the pre-run ``git status`` snapshot for ``context``.
+
+    Returns an empty delta without running git when ``track_git_status`` is
+    off. Backends resolve their executable before calling this, so a missing
+    CLI skips the snapshot entirely.
+    """
+    if not context.track_git_status:
+        return GitStatusDelta(changed=[]), None
+    return compute_status_delta(context.repo_path)
+
+
+def files_changed_since(
+    context: Context, before: GitStatusDelta, pre_warning: str | None
+) -> tuple[list[str], str | None]:
+    """Return files changed since the ``before`` snapshot and an optional warning."""
+    if pre_warning:
+        # The pre-run snapshot already failed, so no file diff can be
+        # reported; skip the second git invocation.
+        return [], f"Git status unavailable: {pre_warning}"
+    after, post_warning = status_snapshot(context)
+    if post_warning:
+        return [], f"Git status unavailable: {post_warning}"
+    return sorted(set(after.changed) - set(before.changed)), None
+
+
+def read_env_snapshot(keys: tuple[str, ...]) -> dict[str, str]:
+    """Read ``keys`` from the environment once, dropping unset or blank values."""
+    snapshot: dict[str, str] = {}
+    for key in keys:
+        value = os.environ.get(key)
+        if value is not None:
+            stripped = value.strip()
+            if stripped:
+                snapshot[key] = stripped
+    return snapshot
+
+
+def decode_output(raw: bytes) -> str:
+    """Decode captured CLI output, replacing undecodable bytes."""
+    return raw.decode("utf-8", errors="replace")
+
+
+def parse_json_output(raw: bytes) -> Any:
+    """Parse JSON from captured CLI output.
+
+    Bytes are handed to the parser directly. Output that is not valid UTF-8
+    is parsed again after ``decode_output``, so a stray byte turns into a
+    replacement character instead of failing the whole parse.
+    """
+    try:
+        return json_loads(raw)
+    except ValueError:
+        # orjson reports bad UTF-8 as a JSONDecodeError rather than a
+        # UnicodeDecodeError, so check the bytes themselves.
+        try:
+            raw.decode("utf-8")
+        except UnicodeDecodeError:
+            return json_loads(decode_output(raw))
+        raise
+
+
+def is_str_list(value: object) -> TypeGuard[list[str]]:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def merge_details_and_notes(details: str, notes: list[str]) -> str:
+    """Append ``notes`` to ``details`` as a bulleted "Notes:" block."""
+    if not notes:
+        return details
+    notes_block = "Notes:\n- " + "\n- ".join(notes)
+    # rstrip() is empty exactly when strip() is, so one pass covers both the
+    # blank-details check and the trimmed prefix.
+    trimmed = details.rstrip()
+    if trimmed:
+        return f"{trimmed}\n\n{notes_block}"
+    return notes_block
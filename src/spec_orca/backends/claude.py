@@ -2,21 +2,30 @@
 
 from __future__ import annotations
 
-import json
-import shutil
+import asyncio
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from spec_orca.backend import Backend
-from spec_orca.backends.claude_schema import STRUCTURED_SCHEMA, render_prompt
-from spec_orca.git_ops import GitStatusDelta, compute_status_delta
+from spec_orca.backends._common import (
+    ExecutableLookup,
+    communicate_async,
+    decode_output,
+    files_changed_since,
+    is_str_list,
+    merge_details_and_notes,
+    parse_json_output,
+    read_env_snapshot,
+    status_snapshot,
+)
+from spec_orca.backends.claude_schema import STRUCTURED_SCHEMA_JSON, render_prompt
+from spec_orca.git_ops import GitStatusDelta
 from spec_orca.models import Context, Result, ResultStatus, Spec
 
 __all__ = ["ClaudeCodeBackend", "ClaudeCodeConfig"]
 
-
 _DEFAULT_TIMEOUT = 300
 _DEFAULT_EXECUTABLE = "claude"
 
@@ -28,9 +37,25 @@ _ENV_MAX_TURNS = "CLAUDE_CODE_MAX_TURNS"
 _ENV_MAX_BUDGET = "CLAUDE_CODE_MAX_BUDGET_USD"
 _ENV_TIMEOUT = "CLAUDE_CODE_TIMEOUT"
 _ENV_NO_SESSION = "CLAUDE_CODE_NO_SESSION_PERSISTENCE"
-
-
-@dataclass(frozen=True)
+_ENV_KEYS = (
+    _ENV_EXECUTABLE,
+    _ENV_ALLOWED_TOOLS,
+    _ENV_DISALLOWED_TOOLS,
+    _ENV_TOOLS,
+    _ENV_MAX_TURNS,
+    _ENV_MAX_BUDGET,
+    _ENV_TIMEOUT,
+    _ENV_NO_SESSION,
+)
+
+_STRUCTURED_STATUSES: dict[str, ResultStatus] = {
+    "success": ResultStatus.SUCCESS,
+    "partial": ResultStatus.PARTIAL,
+    "failure": ResultStatus.FAILURE,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ClaudeCodeConfig:
     """Configuration options for the Claude Code backend."""
 
@@ -47,61 +72,139 @@ class ClaudeCodeConfig:
 class ClaudeCodeBackend(Backend):
     """Backend that shells out to the Claude Code CLI."""
 
+    __slots__ = (
+        "_allowed_tools",
+        "_command_options",
+        "_disallowed_tools",
+        "_executable",
+        "_lookup",
+        "_max_budget_usd",
+        "_max_turns",
+        "_no_session_persistence",
+        "_timeout",
+        "_tools",
+    )
+
     def __init__(self, config: ClaudeCodeConfig | None = None) -> None:
         resolved = config or ClaudeCodeConfig()
-        env_executable = _read_env_value(_ENV_EXECUTABLE)
-        self._executable = resolved.executable or env_executable or _DEFAULT_EXECUTABLE
-        self._allowed_tools = resolved.allowed_tools or _env_list(_ENV_ALLOWED_TOOLS)
-        self._disallowed_tools = resolved.disallowed_tools or _env_list(_ENV_DISALLOWED_TOOLS)
-        self._tools = resolved.tools or _env_list(_ENV_TOOLS)
-        self._max_turns = resolved.max_turns or _env_int(_ENV_MAX_TURNS)
-        self._max_budget_usd = resolved.max_budget_usd or _env_float(_ENV_MAX_BUDGET)
-        self._timeout = resolved.timeout or _env_int(_ENV_TIMEOUT) or _DEFAULT_TIMEOUT
-        env_no_session = _env_bool(_ENV_NO_SESSION)
+        env = read_env_snapshot(_ENV_KEYS)
+        self._executable = resolved.executable or env.get(_ENV_EXECUTABLE) or _DEFAULT_EXECUTABLE
+        self._allowed_tools = resolved.allowed_tools or _env_list(env.get(_ENV_ALLOWED_TOOLS))
+        self._disallowed_tools = resolved.disallowed_tools or _env_list(
+            env.get(_ENV_DISALLOWED_TOOLS)
+        )
+        self._tools = resolved.tools or _env_list(env.get(_ENV_TOOLS))
+        self._max_turns = resolved.max_turns or _env_int(env.get(_ENV_MAX_TURNS))
+        self._max_budget_usd = resolved.max_budget_usd or _env_float(env.get(_ENV_MAX_BUDGET))
+        self._timeout = resolved.timeout or _env_int(env.get(_ENV_TIMEOUT)) or _DEFAULT_TIMEOUT
+        env_no_session = _env_bool(env.get(_ENV_NO_SESSION))
         self._no_session_persistence = (
             resolved.no_session_persistence
             if resolved.no_session_persistence is not None
             else (env_no_session if env_no_session is not None else True)
         )
+        self._lookup = ExecutableLookup(self._executable)
+        # The options after the prompt only depend on the settings above, so
+        # they are assembled once rather than on every execute().
+        self._command_options = self._build_command_options()
 
     def execute(self, spec: Spec, context: Context) -> Result:
-        pre_delta, pre_warning = compute_status_delta(context.repo_path)
-        prompt = render_prompt(spec, context)
-        executable = self._resolve_executable()
+        executable = self._lookup.resolve()
         if executable is None:
-            return _failure_result(
-                "Claude Code CLI not found",
-                (
-                    f"Claude Code CLI not found: '{self._executable}'. "
-                    "Install it (see https://docs.anthropic.com/en/docs/claude-code) "
-                    "or set CLAUDE_CODE_EXECUTABLE to the correct path."
-                ),
-            )
+            return self._missing_executable_result()
+        pre_delta, pre_warning = status_snapshot(context)
+        prompt = render_prompt(spec, context)
 
         cmd = self._build_command(executable, prompt)
         try:
+            # Capture raw bytes: the JSON parser reads them directly, so the
+            # full output is never decoded into an intermediate str.
             proc = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=self._timeout,
                 cwd=context.repo_path,
             )
         except subprocess.TimeoutExpired:
-            return _failure_result(
-                "Claude Code timed out",
-                f"Claude Code timed out after {self._timeout} seconds.",
+            return self._timeout_result()
+
+        return self._finish_execute(
+            context, proc.returncode, proc.stdout, proc.stderr, pre_delta, pre_warning
+        )
+
+    async def execute_async(self, spec: Spec, context: Context) -> Result:
+        """Execute a spec without blocking the event loop.
+
+        Mirrors ``execute()`` but spawns the CLI with
+        ``asyncio.create_subprocess_exec`` so many invocations can overlap.
+        """
+        executable = self._lookup.resolve()
+        if executable is None:
+            return self._missing_executable_result()
+        pre_delta, pre_warning = await asyncio.to_thread(status_snapshot, context)
+        prompt = render_prompt(spec, context)
+
+        cmd = self._build_command(executable, prompt)
+        completed = await communicate_async(cmd, cwd=context.repo_path, timeout=self._timeout)
+        if completed is None:
+            return self._timeout_result()
+
+        returncode, stdout, stderr = completed
+        return await asyncio.to_thread(
+            self._finish_execute,
+            context,
+            returncode,
+            stdout,
+            stderr,
+            pre_delta,
+            pre_warning,
+        )
+
+    def chat(self, prompt: str, *, cwd: Path | None = None) -> str:
+        """Send a conversational prompt and return raw text (no structured output)."""
+        executable = self._lookup.resolve()
+        if executable is None:
+            return f"Error: Claude Code CLI not found: '{self._executable}'"
+
+        cmd = self._build_chat_command(executable, prompt)
+        try:
+            proc = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=self._timeout,
+                cwd=cwd,
             )
+        except subprocess.TimeoutExpired:
+            return f"Error: Claude Code timed out after {self._timeout} seconds."
 
         if proc.returncode != 0:
             output = proc.stderr.strip() or proc.stdout.strip() or f"Exit code {proc.returncode}"
+            return f"Error: Claude Code failed (exit {proc.returncode}): {output}"
+
+        return proc.stdout.strip()
+
+    def _finish_execute(
+        self,
+        context: Context,
+        returncode: int,
+        stdout: bytes,
+        stderr: bytes,
+        pre_delta: GitStatusDelta,
+        pre_warning: str | None,
+    ) -> Result:
+        if returncode != 0:
+            output = (
+                decode_output(stderr).strip()
+                or decode_output(stdout).strip()
+                or f"Exit code {returncode}"
+            )
             return _failure_result(
                 "Claude Code exited with non-zero status",
-                f"Claude Code failed (exit {proc.returncode}): {output}",
+                f"Claude Code failed (exit {returncode}): {output}",
             )
 
-        post_delta, post_warning = compute_status_delta(context.repo_path)
-        parsed = _parse_json(proc.stdout)
+        parsed = _parse_json(stdout)
         if isinstance(parsed, str):
             return _failure_result("Claude Code returned invalid JSON", parsed)
 
@@ -125,10 +228,10 @@ class ClaudeCodeBackend(Backend):
             # Structured output missing — Claude likely ran out of turns.
             # Synthesise a result from the envelope so partial work is not lost.
             result = _synthesize_from_envelope(parsed)
-        files_changed, warning = _delta_files(pre_delta, post_delta, pre_warning, post_warning)
+        files_changed, warning = files_changed_since(context, pre_delta, pre_warning)
         details = result.details
         if warning:
-            details = _merge_details_and_notes(details, [warning])
+            details = merge_details_and_notes(details, [warning])
         return Result(
             status=result.status,
             summary=result.summary,
@@ -139,32 +242,21 @@ class ClaudeCodeBackend(Backend):
             structured_output=result.structured_output,
         )
 
-    def chat(self, prompt: str, *, cwd: Path | None = None) -> str:
-        """Send a conversational prompt and return raw text (no structured output)."""
-        executable = self._resolve_executable()
-        if executable is None:
-            return f"Error: Claude Code CLI not found: '{self._executable}'"
-
-        cmd = self._build_chat_command(executable, prompt)
-        try:
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=self._timeout,
-                cwd=cwd,
-            )
-        except subprocess.TimeoutExpired:
-            return f"Error: Claude Code timed out after {self._timeout} seconds."
-
-        if proc.returncode != 0:
-            output = proc.stderr.strip() or proc.stdout.strip() or f"Exit code {proc.returncode}"
-            return f"Error: Claude Code failed (exit {proc.returncode}): {output}"
-
-        return proc.stdout.strip()
+    def _missing_executable_result(self) -> Result:
+        return _failure_result(
+            "Claude Code CLI not found",
+            (
+                f"Claude Code CLI not found: '{self._executable}'. "
+                "Install it (see https://docs.anthropic.com/en/docs/claude-code) "
+                "or set CLAUDE_CODE_EXECUTABLE to the correct path."
+            ),
+        )
 
-    def _resolve_executable(self) -> str | None:
-        return shutil.which(self._executable)
+    def _timeout_result(self) -> Result:
+        return _failure_result(
+            "Claude Code timed out",
+            f"Claude Code timed out after {self._timeout} seconds.",
+        )
 
     def _build_chat_command(self, executable: str, prompt: str) -> list[str]:
         cmd = [executable, "-p", "--output-format", "text", prompt]
@@ -177,34 +269,38 @@ class ClaudeCodeBackend(Backend):
         return cmd
 
     def _build_command(self, executable: str, prompt: str) -> list[str]:
-        cmd = [
+        return [
             executable,
             "-p",
             "--output-format",
             "json",
             "--json-schema",
-            json.dumps(STRUCTURED_SCHEMA, separators=(",", ":")),
+            STRUCTURED_SCHEMA_JSON,
             prompt,
+            *self._command_options,
         ]
+
+    def _build_command_options(self) -> tuple[str, ...]:
+        options: list[str] = []
         if self._allowed_tools:
-            cmd.extend(["--allowedTools", ",".join(self._allowed_tools)])
+            options.extend(["--allowedTools", ",".join(self._allowed_tools)])
         if self._disallowed_tools:
-            cmd.extend(["--disallowedTools", ",".join(self._disallowed_tools)])
+            options.extend(["--disallowedTools", ",".join(self._disallowed_tools)])
         if self._tools:
-            cmd.extend(["--tools", ",".join(self._tools)])
+            options.extend(["--tools", ",".join(self._tools)])
         if self._max_turns is not None:
-            cmd.extend(["--max-turns", str(self._max_turns)])
+            options.extend(["--max-turns", str(self._max_turns)])
         if self._max_budget_usd is not None:
-            cmd.extend(["--max-budget-usd", str(self._max_budget_usd)])
+            options.extend(["--max-budget-usd", str(self._max_budget_usd)])
         if self._no_session_persistence:
-            cmd.append("--no-session-persistence")
-        return cmd
+            options.append("--no-session-persistence")
+        return tuple(options)
 
 
-def _parse_json(raw: str) -> dict[str, Any] | str:
+def _parse_json(raw: bytes) -> dict[str, Any] | str:
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        data = parse_json_output(raw)
+    except ValueError as exc:
         return f"Invalid JSON output: {str(exc).strip()}"
     if not isinstance(data, dict):
         return "Expected JSON object output from Claude Code."
@@ -215,13 +311,8 @@ def _result_from_structured(structured: dict[str, Any]) -> Result | str:
     status_raw = structured.get("status")
     if not isinstance(status_raw, str):
         return "structured_output.status must be a string"
-    if status_raw == "success":
-        status = ResultStatus.SUCCESS
-    elif status_raw == "partial":
-        status = ResultStatus.PARTIAL
-    elif status_raw == "failure":
-        status = ResultStatus.FAILURE
-    else:
+    status = _STRUCTURED_STATUSES.get(status_raw)
+    if status is None:
         return "structured_output.status must be one of: success, partial, failure"
 
     summary = structured.get("summary")
@@ -233,20 +324,18 @@ def _result_from_structured(structured: dict[str, Any]) -> Result | str:
         return "structured_output.details must be a string"
 
     commands_run = structured.get("commands_run", [])
-    if not isinstance(commands_run, list) or not all(
-        isinstance(item, str) for item in commands_run
-    ):
+    if not is_str_list(commands_run):
         return "structured_output.commands_run must be a list of strings"
 
     notes = structured.get("notes", [])
-    if not isinstance(notes, list) or not all(isinstance(item, str) for item in notes):
+    if not is_str_list(notes):
         return "structured_output.notes must be a list of strings"
 
     error = structured.get("error")
     if error is not None and not isinstance(error, str):
         return "structured_output.error must be a string or null"
 
-    details = _merge_details_and_notes(details, notes)
+    details = merge_details_and_notes(details, notes)
 
     return Result(
         status=status,
@@ -331,46 +420,13 @@ def _failure_result(summary: str, error: str) -> Result:
     )
 
 
-def _merge_details_and_notes(details: str, notes: list[str]) -> str:
-    if not notes:
-        return details
-    notes_block = "\n".join(f"- {note}" for note in notes)
-    if details.strip():
-        return f"{details.rstrip()}\n\nNotes:\n{notes_block}"
-    return f"Notes:\n{notes_block}"
-
-
-def _delta_files(
-    before: GitStatusDelta,
-    after: GitStatusDelta,
-    pre_warning: str | None,
-    post_warning: str | None,
-) -> tuple[list[str], str | None]:
-    if pre_warning or post_warning:
-        warning = pre_warning or post_warning
-        return [], f"Git status unavailable: {warning}"
-    changed = sorted(set(after.changed) - set(before.changed))
-    return changed, None
-
-
-def _read_env_value(key: str) -> str | None:
-    import os
-
-    value = os.environ.get(key)
-    if value is None:
-        return None
-    return value.strip() or None
-
-
-def _env_list(key: str) -> list[str] | None:
-    raw = _read_env_value(key)
+def _env_list(raw: str | None) -> list[str] | None:
     if not raw:
         return None
     return [item.strip() for item in raw.split(",") if item.strip()]
 
 
-def _env_int(key: str) -> int | None:
-    raw = _read_env_value(key)
+def _env_int(raw: str | None) -> int | None:
     if not raw:
         return None
     try:
@@ -379,8 +435,7 @@ def _env_int(key: str) -> int | None:
         return None
 
 
-def _env_float(key: str) -> float | None:
-    raw = _read_env_value(key)
+def _env_float(raw: str | None) -> float | None:
     if not raw:
         return None
     try:
@@ -389,8 +444,7 @@ def _env_float(key: str) -> float | None:
         return None
 
 
-def _env_bool(key: str) -> bool | None:
-    raw = _read_env_value(key)
+def _env_bool(raw: str | None) -> bool | None:
     if not raw:
         return None
     return raw.lower() in {"1", "true", "yes", "on"}
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import json
 from typing import Any
 
 from spec_orca.models import Context, Spec
 
-__all__ = ["STRUCTURED_SCHEMA", "render_prompt"]
+__all__ = ["STRUCTURED_SCHEMA", "STRUCTURED_SCHEMA_JSON", "render_prompt"]
 
 STRUCTURED_SCHEMA: dict[str, Any] = {
     "type": "object",
@@ -38,34 +39,37 @@ STRUCTURED_SCHEMA: dict[str, Any] = {
     "additionalProperties": True,
 }
 
+# Compact serialization passed to ``claude --json-schema``; the schema is
+# static, so it is encoded once at import rather than per invocation.
+STRUCTURED_SCHEMA_JSON: str = json.dumps(STRUCTURED_SCHEMA, separators=(",", ":"))
 
-def render_prompt(spec: Spec, context: Context) -> str:
-    """Render a stable prompt that instructs Claude to return structured output."""
-    lines = [
-        "You are implementing a spec in a git repository.",
-        "Constraints:",
-        f"- Repo root: {context.repo_path}",
-        "- Only modify files inside the repo.",
-        "- Do not introduce unrelated changes.",
-        "",
-        "Spec:",
-        f"- ID: {spec.id}",
-        f"- Title: {spec.title}",
-    ]
-    if spec.description:
-        lines.append(f"- Description: {spec.description}")
-    lines.append("Acceptance Criteria (verbatim):")
-    if spec.acceptance_criteria:
-        lines.extend(f"- {item}" for item in spec.acceptance_criteria)
-    else:
-        lines.append("- (none)")
-    lines.extend(
-        [
-            "",
-            "Instructions:",
-            "- Implement the spec.",
-            "- If acceptance criteria mention tests or linting, run the relevant checks.",
-            "- Return JSON that conforms to the provided JSON Schema.",
-        ]
+_SCHEMA_INSTRUCTION = "\n- Return JSON that conforms to the provided JSON Schema."
+
+
+def render_prompt(spec: Spec, context: Context, *, include_schema_instruction: bool = True) -> str:
+    """Render a stable prompt that instructs Claude to return structured output.
+
+    With ``include_schema_instruction=False`` the final JSON Schema
+    instruction is omitted, for backends that are not given a schema.
+    """
+    description = f"\n- Description: {spec.description}" if spec.description else ""
+    criteria = "\n".join(f"- {item}" for item in spec.acceptance_criteria) or "- (none)"
+    schema = _SCHEMA_INSTRUCTION if include_schema_instruction else ""
+    return (
+        "You are implementing a spec in a git repository.\n"
+        "Constraints:\n"
+        f"- Repo root: {context.repo_path}\n"
+        "- Only modify files inside the repo.\n"
+        "- Do not introduce unrelated changes.\n"
+        "\n"
+        "Spec:\n"
+        f"- ID: {spec.id}\n"
+        f"- Title: {spec.title}{description}\n"
+        "Acceptance Criteria (verbatim):\n"
+        f"{criteria}\n"
+        "\n"
+        "Instructions:\n"
+        "- Implement the spec.\n"
+        "- If acceptance criteria mention tests or linting, run the relevant checks."
+        f"{schema}"
     )
-    return "\n".join(lines)
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
-import json
-import shutil
+import asyncio
 import subprocess
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
 from spec_orca.backend import Backend
+from spec_orca.backends._common import (
+    ExecutableLookup,
+    communicate_async,
+    decode_output,
+    files_changed_since,
+    is_str_list,
+    json_loads,
+    merge_details_and_notes,
+    parse_json_output,
+    read_env_snapshot,
+    status_snapshot,
+)
 from spec_orca.backends.codex_schema import render_codex_prompt
-from spec_orca.git_ops import GitStatusDelta, compute_status_delta
+from spec_orca.git_ops import GitStatusDelta
 from spec_orca.models import Context, Result, ResultStatus, Spec
 
 __all__ = ["CodexBackend", "CodexConfig"]
@@ -22,6 +34,14 @@ _DEFAULT_EXECUTABLE = "codex"
 _ENV_EXECUTABLE = "CODEX_EXECUTABLE"
 _ENV_TIMEOUT = "CODEX_TIMEOUT"
 _ENV_MODEL = "CODEX_MODEL"
+_ENV_KEYS = (_ENV_EXECUTABLE, _ENV_TIMEOUT, _ENV_MODEL)
+
+_RESULT_STATUSES: dict[str, ResultStatus] = {
+    "success": ResultStatus.SUCCESS,
+    "partial": ResultStatus.PARTIAL,
+    "failure": ResultStatus.FAILURE,
+    "error": ResultStatus.ERROR,
+}
 
 
 @dataclass(frozen=True)
@@ -38,31 +58,79 @@ class CodexBackend(Backend):
 
     def __init__(self, config: CodexConfig | None = None) -> None:
         resolved = config or CodexConfig()
-        env_executable = _read_env_value(_ENV_EXECUTABLE)
-        env_timeout = _env_int(_ENV_TIMEOUT)
-        env_model = _read_env_value(_ENV_MODEL)
+        env = read_env_snapshot(_ENV_KEYS)
+        env_timeout = _env_int(env.get(_ENV_TIMEOUT))
 
-        self._executable = resolved.executable or env_executable or _DEFAULT_EXECUTABLE
+        self._executable = resolved.executable or env.get(_ENV_EXECUTABLE) or _DEFAULT_EXECUTABLE
         self._timeout = (
             resolved.timeout if resolved.timeout is not None else (env_timeout or _DEFAULT_TIMEOUT)
         )
-        self._model = resolved.model or env_model
+        self._model = resolved.model or env.get(_ENV_MODEL)
+        self._lookup = ExecutableLookup(self._executable)
+        # Model flags are fixed per backend, so they are built once here.
+        self._command_options = self._build_command_options()
 
     def execute(self, spec: Spec, context: Context) -> Result:
-        pre_delta, pre_warning = compute_status_delta(context.repo_path)
-        prompt = render_codex_prompt(spec, context)
-        executable = self._resolve_executable()
+        executable = self._lookup.resolve()
         if executable is None:
-            return _failure_result(
-                "Codex CLI not found",
-                (
-                    f"Codex CLI not found: '{self._executable}'. "
-                    "Install Codex CLI and ensure it is on PATH, "
-                    "or set CODEX_EXECUTABLE to the full path."
-                ),
+            return self._missing_executable_result()
+        pre_delta, pre_warning = status_snapshot(context)
+        prompt = render_codex_prompt(spec, context)
+
+        cmd = self._build_command(executable, prompt)
+        try:
+            # Capture raw bytes: the JSON parser reads them directly, so the
+            # event stream is only decoded when a text fallback is needed.
+            proc = subprocess.run(
+                cmd,
+                capture_output=True,
+                timeout=self._timeout,
+                cwd=context.repo_path,
             )
+        except subprocess.TimeoutExpired:
+            return self._timeout_result()
+
+        return self._finish_execute(
+            context, proc.returncode, proc.stdout, proc.stderr, pre_delta, pre_warning
+        )
+
+    async def execute_async(self, spec: Spec, context: Context) -> Result:
+        """Execute a spec without blocking the event loop.
+
+        Mirrors ``execute()`` but spawns the CLI with
+        ``asyncio.create_subprocess_exec`` so many invocations can overlap.
+        """
+        executable = self._lookup.resolve()
+        if executable is None:
+            return self._missing_executable_result()
+        pre_delta, pre_warning = await asyncio.to_thread(status_snapshot, context)
+        prompt = render_codex_prompt(spec, context)
 
         cmd = self._build_command(executable, prompt)
+        completed = await communicate_async(cmd, cwd=context.repo_path, timeout=self._timeout)
+        if completed is None:
+            return self._timeout_result()
+
+        returncode, stdout, stderr = completed
+        return await asyncio.to_thread(
+            self._finish_execute,
+            context,
+            returncode,
+            stdout,
+            stderr,
+            pre_delta,
+            pre_warning,
+        )
+
+    def chat(self, prompt: str, *, cwd: Path | None = None) -> str:
+        """Send a conversational prompt and return raw text (no JSON mode)."""
+        executable = self._lookup.resolve()
+        if executable is None:
+            return f"Error: Codex CLI not found: '{self._executable}'"
+
+        cmd = [executable, "exec", "--full-auto", prompt]
+        if self._model:
+            cmd.extend(["--model", self._model])
         try:
             proc = subprocess.run(
                 cmd,
@@ -71,30 +139,42 @@ class CodexBackend(Backend):
                 encoding="utf-8",
                 errors="replace",
                 timeout=self._timeout,
-                cwd=context.repo_path,
+                cwd=cwd,
             )
         except subprocess.TimeoutExpired:
-            return _failure_result(
-                "Codex timed out",
-                f"Codex timed out after {self._timeout} seconds.",
-            )
+            return f"Error: Codex timed out after {self._timeout} seconds."
 
         if proc.returncode != 0:
-            import sys
-
-            sys.stderr.write(f"DEBUG: Codex stdout:\n{proc.stdout}\n")
-            sys.stderr.write(f"DEBUG: Codex stderr:\n{proc.stderr}\n")
             output = proc.stderr.strip() or proc.stdout.strip() or f"Exit code {proc.returncode}"
+            return f"Error: Codex failed (exit {proc.returncode}): {output}"
+
+        return proc.stdout.strip()
+
+    def _finish_execute(
+        self,
+        context: Context,
+        returncode: int,
+        stdout_raw: bytes,
+        stderr_raw: bytes,
+        pre_delta: GitStatusDelta,
+        pre_warning: str | None,
+    ) -> Result:
+        if returncode != 0:
+            stdout = decode_output(stdout_raw)
+            stderr = decode_output(stderr_raw)
+            sys.stderr.write(f"DEBUG: Codex stdout:\n{stdout}\n")
+            sys.stderr.write(f"DEBUG: Codex stderr:\n{stderr}\n")
+            output = stderr.strip() or stdout.strip() or f"Exit code {returncode}"
             return _failure_result(
                 "Codex exited with non-zero status",
-                f"Codex failed (exit {proc.returncode}): {output}",
+                f"Codex failed (exit {returncode}): {output}",
             )
 
-        post_delta, post_warning = compute_status_delta(context.repo_path)
-        response_text = _extract_result_text(proc.stdout)
+        response_text = _extract_result_text(stdout_raw)
         parsed = _parse_result_payload(response_text)
         if parsed is None:
-            summary = response_text.strip() or "Codex completed successfully."
+            # _extract_result_text already returns stripped text.
+            summary = response_text or "Codex completed successfully."
             parsed = Result(
                 status=ResultStatus.SUCCESS,
                 summary=summary,
@@ -105,10 +185,10 @@ class CodexBackend(Backend):
                 structured_output=None,
             )
 
-        files_changed, warning = _delta_files(pre_delta, post_delta, pre_warning, post_warning)
+        files_changed, warning = files_changed_since(context, pre_delta, pre_warning)
         details = parsed.details
         if warning:
-            details = _merge_details_and_notes(details, [warning])
+            details = merge_details_and_notes(details, [warning])
         return Result(
             status=parsed.status,
             summary=parsed.summary,
@@ -119,50 +199,37 @@ class CodexBackend(Backend):
             structured_output=parsed.structured_output,
         )
 
-    def chat(self, prompt: str, *, cwd: Path | None = None) -> str:
-        """Send a conversational prompt and return raw text (no JSON mode)."""
-        executable = self._resolve_executable()
-        if executable is None:
-            return f"Error: Codex CLI not found: '{self._executable}'"
-
-        cmd = [executable, "exec", "--full-auto", prompt]
-        if self._model:
-            cmd.extend(["--model", self._model])
-        try:
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=self._timeout,
-                cwd=cwd,
-            )
-        except subprocess.TimeoutExpired:
-            return f"Error: Codex timed out after {self._timeout} seconds."
-
-        if proc.returncode != 0:
-            output = proc.stderr.strip() or proc.stdout.strip() or f"Exit code {proc.returncode}"
-            return f"Error: Codex failed (exit {proc.returncode}): {output}"
-
-        return proc.stdout.strip()
+    def _missing_executable_result(self) -> Result:
+        return _failure_result(
+            "Codex CLI not found",
+            (
+                f"Codex CLI not found: '{self._executable}'. "
+                "Install Codex CLI and ensure it is on PATH, "
+                "or set CODEX_EXECUTABLE to the full path."
+            ),
+        )
 
-    def _resolve_executable(self) -> str | None:
-        return shutil.which(self._executable)
+    def _timeout_result(self) -> Result:
+        return _failure_result(
+            "Codex timed out",
+            f"Codex timed out after {self._timeout} seconds.",
+        )
 
     def _build_command(self, executable: str, prompt: str) -> list[str]:
-        cmd = [executable, "exec", "--full-auto", "--json"]
+        return [executable, "exec", "--full-auto", "--json", *self._command_options, prompt]
+
+    def _build_command_options(self) -> tuple[str, ...]:
+        options: list[str] = []
         if self._model:
-            cmd.extend(["--model", self._model])
+            options.extend(["--model", self._model])
             # Workaround: local config defaults to 'xhigh' which is invalid for some models.
             # Override it to 'high' via the correct config key found in ~/.codex/config.toml
             if "gpt-5-codex" in self._model:
-                cmd.extend(["-c", "model_reasoning_effort=high"])
-        cmd.append(prompt)
-        return cmd
+                options.extend(["-c", "model_reasoning_effort=high"])
+        return tuple(options)
 
 
-def _extract_result_text(raw_output: str) -> str:
+def _extract_result_text(raw_output: bytes) -> str:
     whole = _parse_json_object(raw_output)
     if whole is not None:
         result = whole.get("result")
@@ -189,7 +256,7 @@ def _extract_result_text(raw_output: str) -> str:
             latest_message = text.strip()
     if latest_message:
         return latest_message
-    return raw_output.strip()
+    return decode_output(raw_output).strip()
 
 
 def _parse_result_payload(response_text: str) -> Result | None:
@@ -211,15 +278,13 @@ def _parse_result_payload(response_text: str) -> Result | None:
         details = ""
 
     commands_run = payload.get("commands_run", [])
-    if not isinstance(commands_run, list) or not all(
-        isinstance(item, str) for item in commands_run
-    ):
+    if not is_str_list(commands_run):
         commands_run = []
 
     notes = payload.get("notes", [])
-    if not isinstance(notes, list) or not all(isinstance(item, str) for item in notes):
+    if not is_str_list(notes):
         notes = []
-    details = _merge_details_and_notes(details, notes)
+    details = merge_details_and_notes(details, notes)
 
     error = payload.get("error")
     if error is not None and not isinstance(error, str):
@@ -236,13 +301,12 @@ def _parse_result_payload(response_text: str) -> Result | None:
     )
 
 
-def _parse_json_object(raw: str) -> dict[str, object] | None:
-    text = raw.strip()
-    if not text:
-        return None
+def _parse_json_object(raw: str | bytes) -> dict[str, object] | None:
+    # Both parsers skip surrounding whitespace themselves and reject blank
+    # input, so the text is not stripped (copied) first.
     try:
-        parsed = json.loads(text)
-    except json.JSONDecodeError:
+        parsed = parse_json_output(raw) if isinstance(raw, bytes) else json_loads(raw)
+    except ValueError:
         return None
     if isinstance(parsed, dict):
         return cast(dict[str, object], parsed)
@@ -250,16 +314,11 @@ def _parse_json_object(raw: str) -> dict[str, object] | None:
 
 
 def _to_result_status(value: str) -> ResultStatus | None:
-    lowered = value.strip().lower()
-    if lowered == "success":
-        return ResultStatus.SUCCESS
-    if lowered == "partial":
-        return ResultStatus.PARTIAL
-    if lowered == "failure":
-        return ResultStatus.FAILURE
-    if lowered == "error":
-        return ResultStatus.ERROR
-    return None
+    # Exact lowercase values are the common case; normalize only on a miss.
+    status = _RESULT_STATUSES.get(value)
+    if status is None:
+        status = _RESULT_STATUSES.get(value.strip().lower())
+    return status
 
 
 def _failure_result(summary: str, error: str) -> Result:
@@ -274,39 +333,7 @@ def _failure_result(summary: str, error: str) -> Result:
     )
 
 
-def _merge_details_and_notes(details: str, notes: list[str]) -> str:
-    if not notes:
-        return details
-    notes_block = "\n".join(f"- {note}" for note in notes)
-    if details.strip():
-        return f"{details.rstrip()}\n\nNotes:\n{notes_block}"
-    return f"Notes:\n{notes_block}"
-
-
-def _delta_files(
-    before: GitStatusDelta,
-    after: GitStatusDelta,
-    pre_warning: str | None,
-    post_warning: str | None,
-) -> tuple[list[str], str | None]:
-    if pre_warning or post_warning:
-        warning = pre_warning or post_warning
-        return [], f"Git status unavailable: {warning}"
-    changed = sorted(set(after.changed) - set(before.changed))
-    return changed, None
-
-
-def _read_env_value(key: str) -> str | None:
-    import os
-
-    value = os.environ.get(key)
-    if value is None:
-        return None
-    return value.strip() or None
-
-
-def _env_int(key: str) -> int | None:
-    raw = _read_env_value(key)
+def _env_int(raw: str | None) -> int | None:
     if not raw:
         return None
     try:
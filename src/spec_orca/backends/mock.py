@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
 from typing import overload
 
@@ -18,16 +18,21 @@ from spec_orca.models import (
 
 __all__ = ["MockBackend", "MockBackendConfig"]
 
+_RESULT_TO_STEP: dict[ResultStatus, StepStatus] = {
+    ResultStatus.SUCCESS: StepStatus.SUCCESS,
+    ResultStatus.ERROR: StepStatus.ERROR,
+}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class MockBackendConfig:
     """Configuration for deterministic mock responses."""
 
     status: ResultStatus = ResultStatus.SUCCESS
     summary: str | None = None
     details: str = ""
-    files_changed: list[str] = field(default_factory=list)
-    commands_run: list[str] = field(default_factory=list)
+    files_changed: tuple[str, ...] = ()
+    commands_run: tuple[str, ...] = ()
     error: str | None = None
     chat_response: str | None = None
 
@@ -37,6 +42,7 @@ class MockBackend:
 
     def __init__(self, *, config: MockBackendConfig | None = None) -> None:
         self._config = config or MockBackendConfig()
+        self._step_status = _step_status_from_result(self._config.status)
 
     @overload
     def execute(self, instruction: Instruction) -> StepResult: ...
@@ -45,39 +51,45 @@ class MockBackend:
     def execute(self, spec: Spec, context: Context) -> Result: ...
 
     def execute(self, *args: object, **kwargs: object) -> Result | StepResult:
+        # Dispatch on the argument count first so each call shape needs only
+        # the isinstance checks that validate it.
+        if len(args) == 2 and not kwargs:
+            spec, context = args
+            if isinstance(spec, Spec) and isinstance(context, Context):
+                return self.execute_spec(spec, context)
+        elif len(args) == 1 and not kwargs:
+            instruction = args[0]
+            if isinstance(instruction, Instruction):
+                return self.execute_instruction(instruction)
         if args:
             first = args[0]
             if isinstance(first, Instruction):
-                if len(args) != 1:
-                    msg = "execute(instruction) accepts exactly one positional argument"
-                    raise TypeError(msg)
-                return self._execute_instruction(first)
+                msg = "execute(instruction) accepts exactly one positional argument"
+                raise TypeError(msg)
             if isinstance(first, Spec):
-                if len(args) < 2 or not isinstance(args[1], Context):
-                    msg = "execute(spec, context) requires a Context as the second argument"
-                    raise TypeError(msg)
-                return self._execute_spec(first)
+                msg = "execute(spec, context) requires a Context as the second argument"
+                raise TypeError(msg)
         if "spec" in kwargs and "context" in kwargs:
             spec = kwargs.get("spec")
             context = kwargs.get("context")
             if not isinstance(spec, Spec) or not isinstance(context, Context):
                 msg = "execute(spec, context) requires a Spec and Context"
                 raise TypeError(msg)
-            return self._execute_spec(spec)
+            return self.execute_spec(spec, context)
         msg = "execute() requires either (instruction) or (spec, context)"
         raise TypeError(msg)
 
-    def _execute_instruction(self, instruction: Instruction) -> StepResult:
-        step_status = _step_status_from_result(self._config.status)
+    def execute_instruction(self, instruction: Instruction) -> StepResult:
+        """Execute a single-step instruction (``AgentBackendProtocol`` form)."""
         summary = self._config.summary or f"Mock execution of step {instruction.step_index}"
         output = f"[mock] executed: {instruction.prompt}"
         return StepResult(
             step_index=instruction.step_index,
-            status=step_status,
+            status=self._step_status,
             output=output,
             summary=summary,
-            files_touched=tuple(self._config.files_changed),
-            commands_run=tuple(self._config.commands_run),
+            files_touched=self._config.files_changed,
+            commands_run=self._config.commands_run,
         )
 
     def chat(self, prompt: str, *, cwd: Path | None = None) -> str:
@@ -86,7 +98,8 @@ class MockBackend:
             return self._config.chat_response
         return f"[mock] {prompt}"
 
-    def _execute_spec(self, spec: Spec) -> Result:
+    def execute_spec(self, spec: Spec, context: Context) -> Result:
+        """Execute a spec (``Backend`` form)."""
         summary = self._config.summary or f"Mock execution of spec '{spec.title}'"
         return Result(
             status=self._config.status,
@@ -99,8 +112,4 @@ class MockBackend:
 
 
 def _step_status_from_result(status: ResultStatus) -> StepStatus:
-    if status == ResultStatus.SUCCESS:
-        return StepStatus.SUCCESS
-    if status == ResultStatus.ERROR:
-        return StepStatus.ERROR
-    return StepStatus.FAILURE
+    return _RESULT_TO_STEP.get(status, StepStatus.FAILURE)
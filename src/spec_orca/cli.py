@@ -3,22 +3,24 @@
 from __future__ import annotations
 
 import argparse
-import shutil
+import functools
+import os
 import sys
-import textwrap
-import tomllib
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, TypedDict, TypeVar
 
 from spec_orca import __version__
 
 if TYPE_CHECKING:
     from spec_orca.orchestrator import ExecutionSummary
 
+_T = TypeVar("_T")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class _ClaudeResolved:
     claude_bin: str
     claude_allowed_tools: list[str] | None
@@ -30,14 +32,53 @@ class _ClaudeResolved:
     claude_no_session_persistence: bool | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _CodexResolved:
     codex_bin: str
     codex_timeout_seconds: int | None
     codex_model: str | None
 
 
-def build_parser() -> argparse.ArgumentParser:
+# Frozen, so the "nothing configured in the file" result can be shared.
+_EMPTY_CLAUDE_RESOLVED = _ClaudeResolved(
+    claude_bin="",
+    claude_allowed_tools=None,
+    claude_disallowed_tools=None,
+    claude_tools=None,
+    claude_max_turns=None,
+    claude_max_budget_usd=None,
+    claude_timeout_seconds=None,
+    claude_no_session_persistence=None,
+)
+_EMPTY_CODEX_RESOLVED = _CodexResolved(codex_bin="", codex_timeout_seconds=None, codex_model=None)
+
+
+class _BackendOptions(TypedDict):
+    claude_bin: str | None
+    claude_allowed_tools: list[str] | None
+    claude_disallowed_tools: list[str] | None
+    claude_tools: list[str] | None
+    claude_max_turns: int | None
+    claude_max_budget_usd: float | None
+    claude_timeout_seconds: int | None
+    claude_no_session_persistence: bool | None
+    codex_bin: str | None
+    codex_model: str | None
+    codex_timeout_seconds: int | None
+
+
+# Kept in sync with spec_orca.backends; duplicated so that parsing arguments
+# does not import the backend modules.
+_BACKEND_CHOICES: tuple[str, ...] = ("claude", "codex", "mock")
+
+
+def build_parser(commands: Iterable[str] | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    Every subcommand is always registered so that ``--help`` lists them all,
+    but only those named in ``commands`` get their arguments added. ``None``
+    (the default) builds every subcommand in full.
+    """
     parser = argparse.ArgumentParser(
         prog="spec-orca",
         description="SpecOrca — a spec-driven two-role orchestrator (Architect / Agent).",
@@ -49,8 +90,16 @@ def build_parser() -> argparse.ArgumentParser:
     )
 
     subparsers = parser.add_subparsers(dest="command")
+    selected = None if commands is None else frozenset(commands)
+    for name, (help_text, add_arguments) in _SUBCOMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if selected is None or name in selected:
+            add_arguments(subparser)
+
+    return parser
 
-    run_parser = subparsers.add_parser("run", help="Run the orchestration loop.")
+
+def _add_run_parser_args(run_parser: argparse.ArgumentParser) -> None:
     run_parser.add_argument(
         "--spec",
         type=Path,
@@ -67,7 +116,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--backend",
         type=str,
         default=None,
-        choices=["claude", "codex", "mock"],
+        choices=_BACKEND_CHOICES,
         help=(
             "Backend to use for execution. Overrides the SPEC_ORCA_BACKEND env var. Default: mock."
         ),
@@ -125,7 +174,8 @@ def build_parser() -> argparse.ArgumentParser:
         ),
     )
 
-    plan_parser = subparsers.add_parser("plan", help="Validate and print the spec plan.")
+
+def _add_plan_parser_args(plan_parser: argparse.ArgumentParser) -> None:
     plan_parser.add_argument(
         "--spec",
         type=Path,
@@ -133,7 +183,8 @@ def build_parser() -> argparse.ArgumentParser:
         help="Path to the YAML spec file.",
     )
 
-    doctor_parser = subparsers.add_parser("doctor", help="Check environment health.")
+
+def _add_doctor_parser_args(doctor_parser: argparse.ArgumentParser) -> None:
     doctor_parser.add_argument(
         "--spec",
         type=Path,
@@ -144,13 +195,14 @@ def build_parser() -> argparse.ArgumentParser:
         "--backend",
         type=str,
         default=None,
-        choices=["claude", "codex", "mock"],
+        choices=_BACKEND_CHOICES,
         help="Optional backend to validate (defaults to env/default selection).",
     )
     _add_claude_args(doctor_parser)
     _add_codex_args(doctor_parser)
 
-    init_parser = subparsers.add_parser("init", help="Generate a starter spec YAML file.")
+
+def _add_init_parser_args(init_parser: argparse.ArgumentParser) -> None:
     init_parser.add_argument(
         "--goal",
         type=str,
@@ -164,14 +216,13 @@ def build_parser() -> argparse.ArgumentParser:
         help="Output path for the generated spec file (default: spec.yaml).",
     )
 
-    interview_parser = subparsers.add_parser(
-        "interview", help="Start an interactive interview session."
-    )
+
+def _add_interview_parser_args(interview_parser: argparse.ArgumentParser) -> None:
     interview_parser.add_argument(
         "--backend",
         type=str,
         default="claude",
-        choices=["claude", "codex", "mock"],
+        choices=_BACKEND_CHOICES,
         help=(
             "Backend to use for the interview. "
             "Overrides the SPEC_ORCA_BACKEND env var. Default: claude."
@@ -186,7 +237,15 @@ def build_parser() -> argparse.ArgumentParser:
     _add_claude_args(interview_parser)
     _add_codex_args(interview_parser)
 
-    return parser
+
+# Subcommand name -> (help text, argument builder), in ``--help`` order.
+_SUBCOMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "run": ("Run the orchestration loop.", _add_run_parser_args),
+    "plan": ("Validate and print the spec plan.", _add_plan_parser_args),
+    "doctor": ("Check environment health.", _add_doctor_parser_args),
+    "init": ("Generate a starter spec YAML file.", _add_init_parser_args),
+    "interview": ("Start an interactive interview session.", _add_interview_parser_args),
+}
 
 
 def _run_command(
@@ -224,16 +283,17 @@ def _run_command(
     from spec_orca.models import Context
     from spec_orca.orchestrator import Orchestrator
     from spec_orca.spec import SpecValidationError
-    from spec_orca.state import ProjectState, build_state, save_state
 
+    cwd = Path.cwd()
+    resolved_spec = spec_path.resolve()
     try:
-        architect = SimpleArchitect(spec_path)
+        architect = SimpleArchitect(resolved_spec)
     except (FileNotFoundError, SpecValidationError, ValueError) as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return 1
 
     try:
-        config = _load_config(Path.cwd())
+        config = _load_config(cwd)
         name = resolve_backend_name(backend_name)
         claude_resolved = _resolve_claude_config(
             config,
@@ -283,8 +343,8 @@ def _run_command(
 
     goal = goal_override or architect.goal or "unspecified"
     context = Context(
-        repo_path=Path.cwd(),
-        spec_path=spec_path.resolve(),
+        repo_path=cwd,
+        spec_path=resolved_spec,
         goal=goal,
         backend_name=name,
     )
@@ -314,21 +374,14 @@ def _run_command(
             print(f"Error writing report: {exc}", file=sys.stderr)
 
     if state_path is not None:
+        from spec_orca.state import build_state, save_state
+
         try:
             base_state = build_state(context.repo_path)
         except (FileNotFoundError, RuntimeError) as exc:
             print(f"Error: {exc}", file=sys.stderr)
             return 1
-        state = ProjectState(
-            repo_path=base_state.repo_path,
-            git_head_sha=base_state.git_head_sha,
-            tracked_files=base_state.tracked_files,
-            status_summary=base_state.status_summary,
-            diff_summary=base_state.diff_summary,
-            last_test_summary=base_state.last_test_summary,
-            history=list(summary.results),
-        )
-        save_state(state, state_path)
+        save_state(replace(base_state, history=summary.results), state_path)
 
     # -- optional auto-commit -----------------------------------------------
     if auto_commit and not run_success:
@@ -473,7 +526,8 @@ def _interview_command(
     from spec_orca.interview import InterviewAgent, InterviewConfig
 
     name = resolve_backend_name(backend_name)
-    file_config = _load_config(Path.cwd())
+    cwd = Path.cwd()
+    file_config = _load_config(cwd)
     claude_resolved = _resolve_claude_config(
         file_config,
         claude_bin=claude_bin,
@@ -516,7 +570,7 @@ def _interview_command(
         claude_config=claude_config,
         codex_config=codex_config,
     )
-    config = InterviewConfig(repo_path=Path.cwd())
+    config = InterviewConfig(repo_path=cwd)
     agent = InterviewAgent(backend, config)
 
     print(f"Starting interactive interview session (backend={name})...")
@@ -564,7 +618,9 @@ def _interview_command(
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _parser_for(_sniff_command(argv))
     args = parser.parse_args(argv)
 
     if args.command == "run":
@@ -577,9 +633,6 @@ def main(argv: list[str] | None = None) -> int:
         stop_on_failure: bool = args.stop_on_failure
         ac: bool = args.auto_commit
         cp: str | None = args.commit_prefix
-        allowed = _flatten_list(args.claude_allowed_tools)
-        if args.allow_all and not allowed:
-            allowed = list(_ALL_CLAUDE_TOOLS)
         return _run_command(
             spec_path,
             max_steps,
@@ -590,17 +643,7 @@ def main(argv: list[str] | None = None) -> int:
             stop_on_failure=stop_on_failure,
             auto_commit=ac,
             commit_prefix=cp,
-            claude_bin=args.claude_bin,
-            claude_allowed_tools=allowed,
-            claude_disallowed_tools=_flatten_list(args.claude_disallowed_tools),
-            claude_tools=_flatten_list(args.claude_tools),
-            claude_max_turns=args.claude_max_turns,
-            claude_max_budget_usd=args.claude_max_budget_usd,
-            claude_timeout_seconds=args.claude_timeout_seconds,
-            claude_no_session_persistence=args.claude_no_session_persistence,
-            codex_bin=args.codex_bin,
-            codex_model=args.codex_model,
-            codex_timeout_seconds=args.codex_timeout_seconds,
+            **_backend_options(args),
         )
 
     if args.command == "plan":
@@ -610,23 +653,10 @@ def main(argv: list[str] | None = None) -> int:
     if args.command == "doctor":
         doctor_spec_path: Path | None = args.spec
         doctor_backend_name: str | None = args.backend
-        dr_allowed = _flatten_list(args.claude_allowed_tools)
-        if args.allow_all and not dr_allowed:
-            dr_allowed = list(_ALL_CLAUDE_TOOLS)
         return _doctor_command(
             doctor_spec_path,
             doctor_backend_name,
-            claude_bin=args.claude_bin,
-            claude_allowed_tools=dr_allowed,
-            claude_disallowed_tools=_flatten_list(args.claude_disallowed_tools),
-            claude_tools=_flatten_list(args.claude_tools),
-            claude_max_turns=args.claude_max_turns,
-            claude_max_budget_usd=args.claude_max_budget_usd,
-            claude_timeout_seconds=args.claude_timeout_seconds,
-            claude_no_session_persistence=args.claude_no_session_persistence,
-            codex_bin=args.codex_bin,
-            codex_model=args.codex_model,
-            codex_timeout_seconds=args.codex_timeout_seconds,
+            **_backend_options(args),
         )
 
     if args.command == "init":
@@ -645,23 +675,10 @@ def main(argv: list[str] | None = None) -> int:
     if args.command == "interview":
         interview_backend: str | None = args.backend
         interview_output: Path | None = args.output
-        iv_allowed = _flatten_list(args.claude_allowed_tools)
-        if args.allow_all and not iv_allowed:
-            iv_allowed = list(_ALL_CLAUDE_TOOLS)
         return _interview_command(
             interview_backend,
             interview_output,
-            claude_bin=args.claude_bin,
-            claude_allowed_tools=iv_allowed,
-            claude_disallowed_tools=_flatten_list(args.claude_disallowed_tools),
-            claude_tools=_flatten_list(args.claude_tools),
-            claude_max_turns=args.claude_max_turns,
-            claude_max_budget_usd=args.claude_max_budget_usd,
-            claude_timeout_seconds=args.claude_timeout_seconds,
-            claude_no_session_persistence=args.claude_no_session_persistence,
-            codex_bin=args.codex_bin,
-            codex_model=args.codex_model,
-            codex_timeout_seconds=args.codex_timeout_seconds,
+            **_backend_options(args),
         )
 
     # No subcommand — print help by default.
@@ -669,67 +686,120 @@ def main(argv: list[str] | None = None) -> int:
     return 0
 
 
+def _backend_options(args: argparse.Namespace) -> _BackendOptions:
+    """Collect the shared Claude/Codex flags of run, doctor and interview."""
+    allowed = _flatten_list(args.claude_allowed_tools)
+    if args.allow_all and not allowed:
+        allowed = list(_ALL_CLAUDE_TOOLS)
+    return _BackendOptions(
+        claude_bin=args.claude_bin,
+        claude_allowed_tools=allowed,
+        claude_disallowed_tools=_flatten_list(args.claude_disallowed_tools),
+        claude_tools=_flatten_list(args.claude_tools),
+        claude_max_turns=args.claude_max_turns,
+        claude_max_budget_usd=args.claude_max_budget_usd,
+        claude_timeout_seconds=args.claude_timeout_seconds,
+        claude_no_session_persistence=args.claude_no_session_persistence,
+        codex_bin=args.codex_bin,
+        codex_model=args.codex_model,
+        codex_timeout_seconds=args.codex_timeout_seconds,
+    )
+
+
+@functools.cache
+def _parser_for(command: str | None) -> argparse.ArgumentParser:
+    """Return a parser for ``command``, built once per subcommand.
+
+    ``parse_args`` does not mutate the parser, so repeated ``main`` calls in
+    one process can share it. ``build_parser`` itself stays uncached because
+    callers may customise the parser it returns.
+    """
+    return build_parser(() if command is None else (command,))
+
+
+def _sniff_command(argv: Sequence[str]) -> str | None:
+    """Return the subcommand named in ``argv``, if any.
+
+    The top-level parser only has flag options, so the first positional
+    token is the subcommand.
+    """
+    for token in argv:
+        if not token.startswith("-"):
+            return token if token in _SUBCOMMANDS else None
+    return None
+
+
 def _print_run_summary(summary: ExecutionSummary) -> None:
-    print("Progress:")
+    lines = ["Progress:"]
     if not summary.step_details:
-        print("No steps executed.")
+        lines.append("No steps executed.")
     else:
-        rows = []
-        for step in summary.step_details:
-            rows.append(
-                (
-                    str(step.index),
-                    step.spec_id,
-                    step.result.status.value,
-                    str(step.attempts),
-                    _clean_summary(step.result.summary),
-                )
+        rows = [
+            (
+                str(step.index),
+                step.spec_id,
+                step.result.status.value,
+                str(step.attempts),
+                _clean_summary(step.result.summary),
             )
-        _print_table(["Step", "Spec", "Status", "Attempts", "Summary"], rows)
+            for step in summary.step_details
+        ]
+        lines.append(_format_table(["Step", "Spec", "Status", "Attempts", "Summary"], rows))
 
-    print(
+    lines.append(
         "Totals: "
         f"completed={summary.completed}, "
         f"failed={summary.failed}, "
         f"pending={summary.pending}, "
         f"in_progress={summary.in_progress}"
     )
-    print(f"Stopped: {summary.stopped_reason}")
+    lines.append(f"Stopped: {summary.stopped_reason}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def _print_table(headers: Iterable[str], rows: Iterable[tuple[str, ...]]) -> None:
+def _format_table(headers: Iterable[str], rows: Iterable[tuple[str, ...]]) -> str:
+    header_cells = tuple(headers)
     rows_list = list(rows)
-    widths = [len(header) for header in headers]
-    for row in rows_list:
-        for idx, cell in enumerate(row):
-            widths[idx] = max(widths[idx], len(cell))
+    widths = [max(map(len, column)) for column in zip(header_cells, *rows_list, strict=True)]
+
+    row_format = "  ".join(f"{{:<{width}}}" for width in widths)
+    lines = [row_format.format(*header_cells), "-" * (sum(widths) + 2 * (len(widths) - 1))]
+    lines.extend(row_format.format(*row) for row in rows_list)
+    return "\n".join(lines)
+
 
-    header_line = "  ".join(header.ljust(widths[idx]) for idx, header in enumerate(headers))
-    print(header_line)
-    print("-" * len(header_line))
-    for row in rows_list:
-        line = "  ".join(row[idx].ljust(widths[idx]) for idx in range(len(widths)))
-        print(line)
+_SUMMARY_WIDTH = 60
+_SUMMARY_PLACEHOLDER = "..."
+# Any run of this many words is already wider than _SUMMARY_WIDTH, so words
+# past it never reach the table.
+_SUMMARY_MAX_WORDS = _SUMMARY_WIDTH // 2 + 1
 
 
 def _clean_summary(summary: str) -> str:
-    collapsed = " ".join(summary.split())
-    return textwrap.shorten(collapsed, width=60, placeholder="...")
+    # maxsplit stops scanning long backend output once enough words are found;
+    # the unsplit remainder (if any) is dropped.
+    words = summary.split(maxsplit=_SUMMARY_MAX_WORDS)
+    collapsed = " ".join(words[:_SUMMARY_MAX_WORDS])
+    if len(collapsed) <= _SUMMARY_WIDTH:
+        return collapsed
+    # Cut at the last space that leaves room for the placeholder. Unlike
+    # textwrap.shorten, hyphens are not break points, and a single overlong
+    # first word is truncated rather than replaced by the placeholder alone.
+    limit = _SUMMARY_WIDTH - len(_SUMMARY_PLACEHOLDER)
+    cut = collapsed.rfind(" ", 0, limit + 1)
+    return collapsed[: cut if cut > 0 else limit] + _SUMMARY_PLACEHOLDER
 
 
 def _parse_csv(value: str | None) -> list[str] | None:
     if value is None:
         return None
-    items = [item.strip() for item in value.split(",") if item.strip()]
-    return items or None
+    return _flatten_list([value])
 
 
 def _flatten_list(values: list[str] | None) -> list[str] | None:
     if not values:
         return None
-    flattened: list[str] = []
-    for value in values:
-        flattened.extend(_parse_csv(value) or [])
+    flattened = [item for value in values for raw in value.split(",") if (item := raw.strip())]
     return flattened or None
 
 
@@ -743,33 +813,37 @@ def _check_git() -> tuple[bool, str]:
     import subprocess
 
     try:
-        proc = subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        proc = subprocess.run(["git", "--version"], capture_output=True, timeout=2)
     except OSError as exc:
         return False, f"git not available ({exc})"
+    except subprocess.TimeoutExpired:
+        return False, "git --version timed out"
+    # Output is decoded lazily: only stdout on success, stderr on failure.
     if proc.returncode != 0:
-        return False, proc.stderr.strip() or proc.stdout.strip() or "git command failed"
-    return True, proc.stdout.strip()
+        detail = proc.stderr.strip() or proc.stdout.strip()
+        return False, detail.decode(errors="replace") or "git command failed"
+    return True, proc.stdout.decode(errors="replace").strip()
 
 
 def _check_spec_path(spec_path: Path) -> tuple[bool, str]:
     resolved = spec_path.resolve()
-    if not resolved.exists():
-        return False, f"spec not found: {resolved}"
     if not resolved.is_file():
+        if not resolved.exists():
+            return False, f"spec not found: {resolved}"
         return False, f"spec path is not a file: {resolved}"
     try:
-        resolved.read_text(encoding="utf-8")
+        # Opening and reading one byte proves readability without loading
+        # the whole spec.
+        with resolved.open("rb") as handle:
+            handle.read(1)
     except OSError as exc:
         return False, f"spec not readable: {exc}"
     return True, str(resolved)
 
 
 def _check_claude_executable(executable: str) -> tuple[bool, str]:
+    import shutil
+
     if shutil.which(executable) is None:
         return (
             False,
@@ -782,6 +856,8 @@ def _check_claude_executable(executable: str) -> tuple[bool, str]:
 
 
 def _check_codex_executable(executable: str) -> tuple[bool, str]:
+    import shutil
+
     if shutil.which(executable) is None:
         return (
             False,
@@ -791,15 +867,13 @@ def _check_codex_executable(executable: str) -> tuple[bool, str]:
 
 
 def _read_env_value(key: str) -> str | None:
-    import os
-
     value = os.environ.get(key)
     if value is None:
         return None
     return value.strip() or None
 
 
-_ALL_CLAUDE_TOOLS = [
+_ALL_CLAUDE_TOOLS: tuple[str, ...] = (
     "Bash(*)",
     "Read(*)",
     "Write(*)",
@@ -809,7 +883,7 @@ _ALL_CLAUDE_TOOLS = [
     "WebFetch(*)",
     "WebSearch(*)",
     "NotebookEdit(*)",
-]
+)
 
 
 def _add_claude_args(parser: argparse.ArgumentParser) -> None:
@@ -899,44 +973,92 @@ def _add_codex_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
-def _load_config(cwd: Path) -> dict[str, object]:
+def _load_config(cwd: Path) -> Mapping[str, object]:
     config_path = _read_env_value("SPEC_ORCA_CONFIG")
     if config_path:
         return _load_config_file(Path(config_path))
+    # Opening each candidate directly and treating a missing file as "try the
+    # next one" costs one syscall per candidate instead of exists() + open().
     spec_orca_toml = cwd / "spec-orca.toml"
-    if spec_orca_toml.exists():
-        return _load_config_file(spec_orca_toml)
+    text = _read_optional_config_text(spec_orca_toml)
+    if text is not None:
+        return _parse_config_text(text, spec_orca_toml)
     pyproject = cwd / "pyproject.toml"
-    if pyproject.exists():
-        return _load_pyproject(pyproject)
+    text = _read_optional_config_text(pyproject)
+    if text is not None:
+        return _pyproject_settings(text, pyproject)
     return {}
 
 
-def _load_config_file(path: Path) -> dict[str, object]:
-    try:
-        data = tomllib.loads(path.read_text(encoding="utf-8"))
-    except OSError as exc:
-        raise ValueError(f"Failed to read config file: {path}") from exc
-    except tomllib.TOMLDecodeError as exc:
-        raise ValueError(f"Invalid TOML in config file: {path}") from exc
-    if not isinstance(data, dict):
-        return {}
-    return data
+def _load_config_file(path: Path) -> Mapping[str, object]:
+    return _parse_config_text(_read_config_text(path), path)
+
 
+def _pyproject_settings(text: str, path: Path) -> Mapping[str, object]:
+    """Return the ``[tool.spec_orca]`` table from pyproject.toml text.
 
-def _load_pyproject(path: Path) -> dict[str, object]:
-    data = _load_config_file(path)
+    Files that never mention ``spec_orca`` are skipped without being parsed,
+    because every spelling of the table contains that key name. A
+    pyproject.toml that is not valid TOML is therefore ignored unless it
+    mentions spec_orca. Only files that could hold spec-orca settings
+    produce an "Invalid TOML" error.
+    """
+    if "spec_orca" not in text:
+        return {}
+    data = _parse_config_text(text, path)
     tool = data.get("tool")
-    if not isinstance(tool, dict):
+    if not isinstance(tool, Mapping):
         return {}
     spec_orca = tool.get("spec_orca")
-    if not isinstance(spec_orca, dict):
+    if not isinstance(spec_orca, Mapping):
         return {}
     return spec_orca
 
 
+def _read_config_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError as exc:
+        raise ValueError(f"Failed to read config file: {path}") from exc
+
+
+def _read_optional_config_text(path: Path) -> str | None:
+    try:
+        return path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except OSError as exc:
+        raise ValueError(f"Failed to read config file: {path}") from exc
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_text(text: str, path: Path) -> Mapping[str, object]:
+    # Keyed on the file contents, so repeated main() calls in one process
+    # skip re-parsing unchanged config and any edit is picked up. The cached
+    # result is shared between callers, so it is frozen before it is returned.
+    #
+    # Deferred: only needed when a config file exists, and costs more to
+    # import than the rest of the CLI's stdlib dependencies.
+    import tomllib
+
+    try:
+        data = tomllib.loads(text)
+    except tomllib.TOMLDecodeError as exc:
+        raise ValueError(f"Invalid TOML in config file: {path}") from exc
+    frozen = _freeze_config_value(data)
+    return frozen if isinstance(frozen, Mapping) else {}
+
+
+def _freeze_config_value(value: object) -> object:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_config_value(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_config_value(item) for item in value)
+    return value
+
+
 def _resolve_claude_config(
-    config: dict[str, object],
+    config: Mapping[str, object],
     *,
     claude_bin: str | None = None,
     claude_allowed_tools: list[str] | None = None,
@@ -949,50 +1071,34 @@ def _resolve_claude_config(
 ) -> _ClaudeResolved:
     env = _resolve_env_claude_config()
     file_config = _resolve_file_claude_config(config)
-
-    claude_bin_resolved = file_config.claude_bin or env.claude_bin
-    claude_allowed_resolved = file_config.claude_allowed_tools or env.claude_allowed_tools
-    claude_disallowed_resolved = file_config.claude_disallowed_tools or env.claude_disallowed_tools
-    claude_tools_resolved = file_config.claude_tools or env.claude_tools
-    claude_max_turns_resolved = file_config.claude_max_turns or env.claude_max_turns
-    claude_max_budget_resolved = file_config.claude_max_budget_usd or env.claude_max_budget_usd
-    claude_timeout_resolved = (
-        file_config.claude_timeout_seconds
-        if file_config.claude_timeout_seconds is not None
-        else env.claude_timeout_seconds
-    )
-    claude_no_session_resolved = (
-        file_config.claude_no_session_persistence
-        if file_config.claude_no_session_persistence is not None
-        else env.claude_no_session_persistence
-    )
-
-    if claude_bin is not None:
-        claude_bin_resolved = claude_bin
-    if claude_allowed_tools is not None:
-        claude_allowed_resolved = claude_allowed_tools
-    if claude_disallowed_tools is not None:
-        claude_disallowed_resolved = claude_disallowed_tools
-    if claude_tools is not None:
-        claude_tools_resolved = claude_tools
-    if claude_max_turns is not None:
-        claude_max_turns_resolved = claude_max_turns
-    if claude_max_budget_usd is not None:
-        claude_max_budget_resolved = claude_max_budget_usd
-    if claude_timeout_seconds is not None:
-        claude_timeout_resolved = claude_timeout_seconds
-    if claude_no_session_persistence is not None:
-        claude_no_session_resolved = claude_no_session_persistence
-
+    # Precedence is CLI flag, then config file, then environment; the first
+    # value that is explicitly set wins. An empty claude_bin in the file
+    # means "not set".
     return _ClaudeResolved(
-        claude_bin=claude_bin_resolved,
-        claude_allowed_tools=claude_allowed_resolved,
-        claude_disallowed_tools=claude_disallowed_resolved,
-        claude_tools=claude_tools_resolved,
-        claude_max_turns=claude_max_turns_resolved,
-        claude_max_budget_usd=claude_max_budget_resolved,
-        claude_timeout_seconds=claude_timeout_resolved,
-        claude_no_session_persistence=claude_no_session_resolved,
+        claude_bin=_first_set(claude_bin, file_config.claude_bin or None) or env.claude_bin,
+        claude_allowed_tools=_first_set(
+            claude_allowed_tools, file_config.claude_allowed_tools, env.claude_allowed_tools
+        ),
+        claude_disallowed_tools=_first_set(
+            claude_disallowed_tools,
+            file_config.claude_disallowed_tools,
+            env.claude_disallowed_tools,
+        ),
+        claude_tools=_first_set(claude_tools, file_config.claude_tools, env.claude_tools),
+        claude_max_turns=_first_set(
+            claude_max_turns, file_config.claude_max_turns, env.claude_max_turns
+        ),
+        claude_max_budget_usd=_first_set(
+            claude_max_budget_usd, file_config.claude_max_budget_usd, env.claude_max_budget_usd
+        ),
+        claude_timeout_seconds=_first_set(
+            claude_timeout_seconds, file_config.claude_timeout_seconds, env.claude_timeout_seconds
+        ),
+        claude_no_session_persistence=_first_set(
+            claude_no_session_persistence,
+            file_config.claude_no_session_persistence,
+            env.claude_no_session_persistence,
+        ),
     )
 
 
@@ -1010,19 +1116,13 @@ def _resolve_env_claude_config() -> _ClaudeResolved:
     )
 
 
-def _resolve_file_claude_config(config: dict[str, object]) -> _ClaudeResolved:
+def _resolve_file_claude_config(config: Mapping[str, object]) -> _ClaudeResolved:
+    if not config:
+        return _EMPTY_CLAUDE_RESOLVED
+    # Settings live under a [claude] table, or at the top level of the file.
     value = config.get("claude", config)
-    if not isinstance(value, dict):
-        return _ClaudeResolved(
-            claude_bin="",
-            claude_allowed_tools=None,
-            claude_disallowed_tools=None,
-            claude_tools=None,
-            claude_max_turns=None,
-            claude_max_budget_usd=None,
-            claude_timeout_seconds=None,
-            claude_no_session_persistence=None,
-        )
+    if not isinstance(value, Mapping):
+        return _EMPTY_CLAUDE_RESOLVED
     return _ClaudeResolved(
         claude_bin=_config_str(value.get("claude_bin")) or "",
         claude_allowed_tools=_config_list(value.get("claude_allowed_tools")),
@@ -1036,7 +1136,7 @@ def _resolve_file_claude_config(config: dict[str, object]) -> _ClaudeResolved:
 
 
 def _resolve_codex_config(
-    config: dict[str, object],
+    config: Mapping[str, object],
     *,
     codex_bin: str | None = None,
     codex_model: str | None = None,
@@ -1044,26 +1144,12 @@ def _resolve_codex_config(
 ) -> _CodexResolved:
     env = _resolve_env_codex_config()
     file_config = _resolve_file_codex_config(config)
-
-    codex_bin_resolved = file_config.codex_bin or env.codex_bin
-    codex_model_resolved = file_config.codex_model or env.codex_model
-    codex_timeout_resolved = (
-        file_config.codex_timeout_seconds
-        if file_config.codex_timeout_seconds is not None
-        else env.codex_timeout_seconds
-    )
-
-    if codex_bin is not None:
-        codex_bin_resolved = codex_bin
-    if codex_model is not None:
-        codex_model_resolved = codex_model
-    if codex_timeout_seconds is not None:
-        codex_timeout_resolved = codex_timeout_seconds
-
     return _CodexResolved(
-        codex_bin=codex_bin_resolved,
-        codex_timeout_seconds=codex_timeout_resolved,
-        codex_model=codex_model_resolved,
+        codex_bin=_first_set(codex_bin, file_config.codex_bin or None) or env.codex_bin,
+        codex_timeout_seconds=_first_set(
+            codex_timeout_seconds, file_config.codex_timeout_seconds, env.codex_timeout_seconds
+        ),
+        codex_model=_first_set(codex_model, file_config.codex_model, env.codex_model),
     )
 
 
@@ -1075,14 +1161,12 @@ def _resolve_env_codex_config() -> _CodexResolved:
     )
 
 
-def _resolve_file_codex_config(config: dict[str, object]) -> _CodexResolved:
+def _resolve_file_codex_config(config: Mapping[str, object]) -> _CodexResolved:
+    if not config:
+        return _EMPTY_CODEX_RESOLVED
     value = config.get("codex", config)
-    if not isinstance(value, dict):
-        return _CodexResolved(
-            codex_bin="",
-            codex_timeout_seconds=None,
-            codex_model=None,
-        )
+    if not isinstance(value, Mapping):
+        return _EMPTY_CODEX_RESOLVED
     return _CodexResolved(
         codex_bin=_config_str(value.get("codex_bin")) or "",
         codex_timeout_seconds=_config_int(value.get("codex_timeout_seconds")),
@@ -1090,12 +1174,19 @@ def _resolve_file_codex_config(config: dict[str, object]) -> _CodexResolved:
     )
 
 
+def _first_set(*values: _T | None) -> _T | None:
+    for value in values:
+        if value is not None:
+            return value
+    return None
+
+
 def _config_str(value: object) -> str | None:
     return value if isinstance(value, str) and value.strip() else None
 
 
 def _config_list(value: object) -> list[str] | None:
-    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+    if isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
         items = [item.strip() for item in value if item.strip()]
         return items or None
     return None
@@ -1133,11 +1224,14 @@ def _env_float(key: str) -> float | None:
         return None
 
 
+_TRUTHY_ENV_VALUES: frozenset[str] = frozenset(("1", "true", "yes", "on"))
+
+
 def _env_bool(key: str) -> bool | None:
     raw = _read_env_value(key)
     if raw is None:
         return None
-    return raw.lower() in {"1", "true", "yes", "on"}
+    return raw.lower() in _TRUTHY_ENV_VALUES
 
 
 def _format_python_version() -> str:
@@ -70,7 +70,7 @@ def _utc_now() -> datetime:
     return datetime.now(UTC)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Spec:
     """A loaded specification describing a unit of work."""
 
@@ -87,7 +87,7 @@ class Spec:
     raw_content: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Instruction:
     """A directive from the Architect to the Agent."""
 
@@ -101,7 +101,7 @@ class Instruction:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepResult:
     """Structured result returned by a backend after executing an instruction."""
 
@@ -113,7 +113,7 @@ class StepResult:
     commands_run: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Result:
     """Aggregated outcome of executing a spec (may span multiple steps).
 
@@ -136,13 +136,16 @@ class Result:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Context:
     """Immutable context for an orchestration run.
 
     Captures the environment and configuration under which the orchestration
     loop executes.  Passed to the Architect and Agent so they can make
     informed decisions.
+
+    When ``track_git_status`` is False, backends skip the ``git status``
+    snapshots taken around each execution and report no ``files_changed``.
     """
 
     repo_path: Path
@@ -152,6 +155,7 @@ class Context:
     run_id: str = field(default_factory=_generate_id)
     step: int = 0
     max_steps: int = 1
+    track_git_status: bool = True
 
 
 @dataclass
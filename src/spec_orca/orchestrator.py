@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 
 from spec_orca.agent import Agent
@@ -53,7 +53,7 @@ class ExecutionSummary:
     steps: int
     results: list[Result]
     step_details: list[RunStep]
-    specs: list[Spec]
+    specs: Sequence[Spec]
     completed: int
     failed: int
     pending: int
@@ -0,0 +1,86 @@
+"""Parallel runner that dispatches every runnable spec as soon as it is ready."""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+
+from spec_orca.agent import Agent, error_result
+from spec_orca.architect import SimpleArchitect
+from spec_orca.models import Context, Result, ResultStatus, Spec
+from spec_orca.orchestrator import RunStep
+
+__all__ = ["run_ready_parallel"]
+
+
+def run_ready_parallel(
+    architect: SimpleArchitect,
+    agent: Agent,
+    context: Context,
+    *,
+    max_workers: int = 4,
+    max_steps: int | None = None,
+    stop_on_failure: bool = True,
+) -> list[RunStep]:
+    """Execute runnable specs concurrently, following the dependency graph.
+
+    Up to ``max_workers`` specs run at once. Whenever one finishes, its result
+    is recorded with the architect and any specs it unblocked are dispatched
+    immediately. ``max_steps`` caps the total number of executions. With
+    ``stop_on_failure``, no new specs are started after a failed result, but
+    specs already running are allowed to finish.
+
+    Concurrent specs share ``context.repo_path``, so a ``git status`` delta
+    taken around one spec would also include files changed by the others.
+    When more than one worker is allowed, git status tracking is therefore
+    turned off and results report no ``files_changed``.
+
+    Returns the executed steps in completion order.
+    """
+    if max_workers < 1:
+        msg = "max_workers must be at least 1"
+        raise ValueError(msg)
+    if max_workers > 1 and context.track_git_status:
+        context = replace(context, track_git_status=False)
+
+    step_details: list[RunStep] = []
+    in_flight: dict[Future[Result], Spec] = {}
+    dispatched = 0
+    stopped = False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            if not stopped:
+                for spec in architect.runnable_specs():
+                    if len(in_flight) >= max_workers:
+                        break
+                    if max_steps is not None and dispatched >= max_steps:
+                        break
+                    running = architect.mark_in_progress(spec.id)
+                    in_flight[pool.submit(agent.execute, running, context)] = running
+                    dispatched += 1
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                spec = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    result = error_result(exc)
+                updated = architect.record_result(spec.id, result)
+                step_details.append(
+                    RunStep(
+                        index=len(step_details),
+                        spec_id=spec.id,
+                        title=spec.title,
+                        result=result,
+                        attempts=updated.attempts,
+                    )
+                )
+                if stop_on_failure and result.status != ResultStatus.SUCCESS:
+                    stopped = True
+
+    return step_details
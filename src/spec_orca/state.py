@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import subprocess
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any
 
@@ -53,6 +53,8 @@ def save_state(state: ProjectState, path: Path | None = None) -> Path:
     """Persist a ProjectState snapshot to JSON."""
     target = path or (state.repo_path / _STATE_FILENAME)
     payload = _state_to_dict(state)
+    # Encode fully before touching the file so a serialisation error cannot
+    # leave a truncated snapshot behind.
     target.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
     return target
 
@@ -96,7 +98,9 @@ def _summarize_diff(raw: str) -> str:
 
 
 def _state_to_dict(state: ProjectState) -> dict[str, Any]:
-    payload = asdict(state)
+    # A shallow field walk rather than asdict(): asdict deep-copies every
+    # Result in the history only for it to be replaced below.
+    payload = {item.name: getattr(state, item.name) for item in fields(state)}
     payload["repo_path"] = str(state.repo_path)
     payload["history"] = [_result_to_dict(result) for result in state.history]
     return payload
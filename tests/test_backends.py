@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import subprocess
+import sys
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
 from unittest import mock
 
 import pytest
 
 from spec_orca.backends import (
     ClaudeBackend,
+    ClaudeCodeBackend,
     ClaudeCodeConfig,
     CodexBackend,
     CodexConfig,
@@ -19,6 +24,7 @@ from spec_orca.backends import (
     create_backend,
     resolve_backend_name,
 )
+from spec_orca.backends.claude_schema import STRUCTURED_SCHEMA, STRUCTURED_SCHEMA_JSON
 from spec_orca.git_ops import GitStatusDelta
 from spec_orca.models import (
     Context,
@@ -55,6 +61,38 @@ def _make_context() -> Context:
     )
 
 
+class _FakeAsyncProcess:
+    def __init__(
+        self,
+        stdout: bytes = b"",
+        stderr: bytes = b"",
+        returncode: int = 0,
+        *,
+        hang: bool = False,
+    ) -> None:
+        self._stdout = stdout
+        self._stderr = stderr
+        self._final_returncode = returncode
+        self._hang = hang
+        self.returncode: int | None = None
+        self.killed = False
+        self.started = asyncio.Event()
+
+    async def communicate(self) -> tuple[bytes, bytes]:
+        self.started.set()
+        if self._hang:
+            await asyncio.Event().wait()
+        self.returncode = self._final_returncode
+        return self._stdout, self._stderr
+
+    def kill(self) -> None:
+        self.killed = True
+
+    async def wait(self) -> int:
+        self.returncode = -9
+        return self.returncode
+
+
 # -- resolve_backend_name ---------------------------------------------------
 
 
@@ -83,6 +121,21 @@ class TestResolveBackendName:
     def test_whitespace_stripped(self) -> None:
         assert resolve_backend_name("  mock  ") == "mock"
 
+    def test_does_not_import_backend_modules(self) -> None:
+        code = (
+            "import sys\n"
+            "from spec_orca.backends import resolve_backend_name\n"
+            "resolve_backend_name('claude')\n"
+            "print(sorted(m for m in sys.modules if m.startswith('spec_orca.backends.')))\n"
+        )
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert proc.stdout.strip() == "[]"
+
+    def test_claude_backend_alias(self) -> None:
+        assert ClaudeBackend is ClaudeCodeBackend
+
 
 # -- create_backend ---------------------------------------------------------
 
@@ -152,8 +205,8 @@ class TestMockBackend:
         config = MockBackendConfig(
             status=ResultStatus.FAILURE,
             summary="Forced failure",
-            files_changed=["a.txt", "b.txt"],
-            commands_run=["pytest"],
+            files_changed=("a.txt", "b.txt"),
+            commands_run=("pytest",),
             error="boom",
         )
         backend = MockBackend(config=config)
@@ -166,6 +219,35 @@ class TestMockBackend:
         assert result.commands_run == ["pytest"]
         assert result.error == "boom"
 
+    def test_typed_entry_points_match_execute(self) -> None:
+        backend = MockBackend()
+        instr = _make_instruction()
+        spec, context = _make_spec(), _make_context()
+
+        assert backend.execute_instruction(instr) == backend.execute(instr)
+        assert backend.execute_spec(spec, context) == backend.execute(spec, context)
+
+    def test_execute_rejects_spec_without_context(self) -> None:
+        with pytest.raises(TypeError, match="Context"):
+            MockBackend().execute(_make_spec(), "not a context")  # type: ignore[call-overload]
+
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [
+            (ResultStatus.SUCCESS, StepStatus.SUCCESS),
+            (ResultStatus.ERROR, StepStatus.ERROR),
+            (ResultStatus.FAILURE, StepStatus.FAILURE),
+            (ResultStatus.PARTIAL, StepStatus.FAILURE),
+        ],
+    )
+    def test_step_status_follows_config(self, status: ResultStatus, expected: StepStatus) -> None:
+        backend = MockBackend(config=MockBackendConfig(status=status))
+        assert backend.execute(_make_instruction()).status == expected
+
+    def test_config_is_hashable(self) -> None:
+        config = MockBackendConfig(files_changed=("a.txt",), commands_run=("pytest",))
+        assert hash(config) == hash(replace(config))
+
     def test_create_backend_uses_mock_config(self) -> None:
         config = MockBackendConfig(status=ResultStatus.ERROR, error="bad")
         backend = create_backend("mock", mock_config=config)
@@ -199,7 +281,7 @@ class TestClaudeBackend:
     @pytest.fixture(autouse=True)
     def _stub_git_delta(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setattr(
-            "spec_orca.backends.claude.compute_status_delta",
+            "spec_orca.backends._common.compute_status_delta",
             lambda *_args, **_kwargs: (GitStatusDelta(changed=[]), None),
         )
 
@@ -237,7 +319,7 @@ class TestClaudeBackend:
             }
         )
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json_output, stderr=""
+            args=[], returncode=0, stdout=json_output.encode(), stderr=b""
         )
 
         with (
@@ -249,12 +331,71 @@ class TestClaudeBackend:
         assert result.status == ResultStatus.SUCCESS
         assert result.summary == "All done."
         assert result.commands_run == ["pytest"]
+        assert result.details == "ok\n\nNotes:\n- note one"
         assert result.structured_output is not None
 
+    def test_invalid_utf8_in_output_is_replaced(self) -> None:
+        backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
+        stdout = b'{"structured_output": {"status": "success", "summary": "caf\xe9 done"}}'
+        fake_proc = subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr=b"")
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/claude"),
+            mock.patch("subprocess.run", return_value=fake_proc),
+        ):
+            result = backend.execute(_make_spec(), _make_context())
+
+        assert result.status == ResultStatus.SUCCESS
+        assert result.summary == "caf\ufffd done"
+
+    def test_notes_without_details(self) -> None:
+        backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
+        json_output = json.dumps(
+            {
+                "structured_output": {
+                    "status": "success",
+                    "summary": "All done.",
+                    "details": "  \n",
+                    "notes": ["first", "second"],
+                }
+            }
+        )
+        fake_proc = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=json_output.encode(), stderr=b""
+        )
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/claude"),
+            mock.patch("subprocess.run", return_value=fake_proc),
+        ):
+            result = backend.execute(_make_spec(), _make_context())
+
+        assert result.details == "Notes:\n- first\n- second"
+
+    def test_git_status_skipped_when_not_tracked(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
+        delta = mock.Mock(return_value=(GitStatusDelta(changed=["a.py"]), None))
+        monkeypatch.setattr("spec_orca.backends._common.compute_status_delta", delta)
+        json_output = json.dumps({"structured_output": {"status": "success", "summary": "ok"}})
+        fake_proc = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout=json_output.encode(), stderr=b""
+        )
+        context = replace(_make_context(), track_git_status=False)
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/claude"),
+            mock.patch("subprocess.run", return_value=fake_proc),
+        ):
+            result = backend.execute(_make_spec(), context)
+
+        assert result.status == ResultStatus.SUCCESS
+        assert result.files_changed == []
+        delta.assert_not_called()
+
     def test_nonzero_exit_code(self) -> None:
         backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="", stderr="something broke"
+            args=[], returncode=1, stdout=b"", stderr=b"something broke"
         )
 
         with (
@@ -269,7 +410,7 @@ class TestClaudeBackend:
     def test_nonzero_exit_fallback_to_stdout(self) -> None:
         backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=1, stdout="stdout msg", stderr=""
+            args=[], returncode=1, stdout=b"stdout msg", stderr=b""
         )
 
         with (
@@ -281,9 +422,24 @@ class TestClaudeBackend:
         assert result.status == ResultStatus.FAILURE
         assert "stdout msg" in (result.error or "")
 
+    def test_nonzero_exit_decodes_invalid_utf8(self) -> None:
+        backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
+        fake_proc = subprocess.CompletedProcess(
+            args=[], returncode=1, stdout=b"", stderr=b"bad byte \xff"
+        )
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/claude"),
+            mock.patch("subprocess.run", return_value=fake_proc),
+        ):
+            result = backend.execute(_make_spec(), _make_context())
+
+        assert result.status == ResultStatus.FAILURE
+        assert "bad byte" in (result.error or "")
+
     def test_nonzero_exit_fallback_to_exit_code(self) -> None:
         backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
-        fake_proc = subprocess.CompletedProcess(args=[], returncode=42, stdout="", stderr="")
+        fake_proc = subprocess.CompletedProcess(args=[], returncode=42, stdout=b"", stderr=b"")
 
         with (
             mock.patch("shutil.which", return_value="/usr/bin/claude"),
@@ -309,11 +465,38 @@ class TestClaudeBackend:
         assert result.status == ResultStatus.FAILURE
         assert "timed out" in (result.error or "").lower()
 
+    def test_executable_lookup_cached_after_success(self) -> None:
+        backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
+        fake_proc = subprocess.CompletedProcess(args=[], returncode=0, stdout="ok", stderr="")
+
+        with (
+            mock.patch("shutil.which", side_effect=[None, "/usr/bin/claude"]) as mock_which,
+            mock.patch("subprocess.run", return_value=fake_proc),
+        ):
+            assert backend.chat("hi").startswith("Error:")
+            assert backend.chat("hi") == "ok"
+            assert backend.chat("hi") == "ok"
+
+        assert mock_which.call_count == 2
+
     def test_env_var_overrides_executable(self, monkeypatch: pytest.MonkeyPatch) -> None:
         monkeypatch.setenv("CLAUDE_CODE_EXECUTABLE", "/custom/path/claude")
         backend = ClaudeBackend(ClaudeCodeConfig(executable=None))
         assert backend._executable == "/custom/path/claude"
 
+    def test_env_vars_configure_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("CLAUDE_CODE_ALLOWED_TOOLS", " read:*, write:* ,")
+        monkeypatch.setenv("CLAUDE_CODE_MAX_TURNS", "7")
+        monkeypatch.setenv("CLAUDE_CODE_MAX_BUDGET_USD", "not-a-number")
+        monkeypatch.setenv("CLAUDE_CODE_TIMEOUT", "  ")
+        monkeypatch.setenv("CLAUDE_CODE_NO_SESSION_PERSISTENCE", "false")
+        backend = ClaudeBackend(ClaudeCodeConfig(no_session_persistence=None))  # type: ignore[arg-type]
+        assert backend._allowed_tools == ["read:*", "write:*"]
+        assert backend._max_turns == 7
+        assert backend._max_budget_usd is None
+        assert backend._timeout == 300
+        assert backend._no_session_persistence is False
+
     def test_no_shell_true(self) -> None:
         """Verify subprocess.run is called without shell=True."""
         backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
@@ -330,7 +513,7 @@ class TestClaudeBackend:
             }
         )
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json_output, stderr=""
+            args=[], returncode=0, stdout=json_output.encode(), stderr=b""
         )
 
         with (
@@ -345,7 +528,7 @@ class TestClaudeBackend:
     def test_invalid_json_returns_failure(self) -> None:
         backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout="{bad json", stderr=""
+            args=[], returncode=0, stdout=b"{bad json", stderr=b""
         )
 
         with (
@@ -361,7 +544,7 @@ class TestClaudeBackend:
         """When structured_output is absent but no errors, treat as success."""
         backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json.dumps({"foo": "bar"}), stderr=""
+            args=[], returncode=0, stdout=json.dumps({"foo": "bar"}).encode(), stderr=b""
         )
 
         with (
@@ -377,7 +560,7 @@ class TestClaudeBackend:
         backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
         envelope = {"is_error": True, "errors": ["something went wrong"], "num_turns": 5}
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json.dumps(envelope), stderr=""
+            args=[], returncode=0, stdout=json.dumps(envelope).encode(), stderr=b""
         )
 
         with (
@@ -404,7 +587,7 @@ class TestClaudeBackend:
             }
         )
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json_output, stderr=""
+            args=[], returncode=0, stdout=json_output.encode(), stderr=b""
         )
 
         with (
@@ -442,7 +625,7 @@ class TestClaudeBackend:
             }
         )
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json_output, stderr=""
+            args=[], returncode=0, stdout=json_output.encode(), stderr=b""
         )
 
         with (
@@ -463,6 +646,7 @@ class TestClaudeBackend:
         assert "--max-budget-usd" in cmd
         assert "--no-session-persistence" in cmd
         assert mock_run.call_args.kwargs.get("cwd") == _make_context().repo_path
+        assert not mock_run.call_args.kwargs.get("text")
 
     def test_allowed_tools_are_passed_as_separate_args(self) -> None:
         backend = ClaudeBackend(
@@ -485,7 +669,7 @@ class TestClaudeBackend:
             }
         )
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json_output, stderr=""
+            args=[], returncode=0, stdout=json_output.encode(), stderr=b""
         )
 
         with (
@@ -499,8 +683,8 @@ class TestClaudeBackend:
         assert cmd[allowed_index + 1] == "read:*,write:*"
         assert "--json-schema" in cmd
         schema_index = cmd.index("--json-schema")
-        assert cmd[schema_index + 1].startswith("{")
-        assert cmd[schema_index + 1].endswith("}")
+        assert cmd[schema_index + 1] == STRUCTURED_SCHEMA_JSON
+        assert json.loads(cmd[schema_index + 1]) == STRUCTURED_SCHEMA
 
     def test_invalid_structured_output_returns_failure(self) -> None:
         backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
@@ -517,7 +701,7 @@ class TestClaudeBackend:
             }
         )
         fake_proc = subprocess.CompletedProcess(
-            args=[], returncode=0, stdout=json_output, stderr=""
+            args=[], returncode=0, stdout=json_output.encode(), stderr=b""
         )
 
         with (
@@ -529,6 +713,72 @@ class TestClaudeBackend:
         assert result.status == ResultStatus.FAILURE
         assert "structured_output.status" in (result.error or "")
 
+    def test_execute_async_structured_output(self) -> None:
+        backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
+        json_output = json.dumps(
+            {
+                "structured_output": {
+                    "status": "success",
+                    "summary": "Async done.",
+                    "details": "",
+                    "commands_run": [],
+                    "notes": [],
+                    "error": None,
+                }
+            }
+        ).encode("utf-8")
+        fake_proc = _FakeAsyncProcess(stdout=json_output)
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/claude"),
+            mock.patch("asyncio.create_subprocess_exec", return_value=fake_proc) as mock_exec,
+        ):
+            result = asyncio.run(backend.execute_async(_make_spec(), _make_context()))
+
+        assert result.status == ResultStatus.SUCCESS
+        assert result.summary == "Async done."
+        assert mock_exec.call_args.args[0] == "/usr/bin/claude"
+        assert mock_exec.call_args.kwargs["cwd"] == Path("/tmp")
+
+    def test_execute_async_timeout_kills_process(self) -> None:
+        backend = ClaudeBackend(ClaudeCodeConfig(executable="claude", timeout=5))
+        fake_proc = _FakeAsyncProcess()
+
+        async def _raise_timeout(awaitable: Any, **_kwargs: object) -> object:
+            awaitable.close()
+            raise TimeoutError
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/claude"),
+            mock.patch("asyncio.create_subprocess_exec", return_value=fake_proc),
+            mock.patch("asyncio.wait_for", side_effect=_raise_timeout),
+        ):
+            result = asyncio.run(backend.execute_async(_make_spec(), _make_context()))
+
+        assert result.status == ResultStatus.FAILURE
+        assert "timed out" in (result.error or "").lower()
+        assert fake_proc.killed
+
+    def test_execute_async_cancel_kills_process(self) -> None:
+        backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
+        fake_proc = _FakeAsyncProcess(hang=True)
+
+        async def _cancel_while_running() -> None:
+            task = asyncio.create_task(backend.execute_async(_make_spec(), _make_context()))
+            await fake_proc.started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with (
+            mock.patch("shutil.which", return_value="/usr/bin/claude"),
+            mock.patch("asyncio.create_subprocess_exec", return_value=fake_proc),
+        ):
+            asyncio.run(_cancel_while_running())
+
+        assert fake_proc.killed
+        assert fake_proc.returncode == -9
+
     def test_chat_returns_text(self) -> None:
         backend = ClaudeBackend(ClaudeCodeConfig(executable="claude"))
         fake_proc = subprocess.CompletedProcess(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
 from pathlib import Path
 from unittest import mock
 
@@ -143,6 +144,20 @@ class TestBuildParser:
         args = parser.parse_args(["run", "--spec", "foo.yaml", "--backend", "codex"])
         assert args.backend == "codex"
 
+    def test_unselected_subcommands_have_no_arguments(self) -> None:
+        parser = build_parser(["plan"])
+        args = parser.parse_args(["plan", "--spec", "foo.yaml"])
+        assert args.spec == Path("foo.yaml")
+        with pytest.raises(SystemExit):
+            parser.parse_args(["run", "--spec", "foo.yaml"])
+
+    def test_help_lists_all_subcommands(self, capsys: pytest.CaptureFixture[str]) -> None:
+        with pytest.raises(SystemExit, match="0"):
+            main(["--help"])
+        out = capsys.readouterr().out
+        for name in ("run", "plan", "doctor", "init", "interview"):
+            assert name in out
+
 
 class TestInterviewSubcommand:
     def test_interview_subparser_exists(self) -> None:
@@ -210,6 +225,16 @@ class TestMain:
     def test_returns_zero(self) -> None:
         assert main([]) == 0
 
+    def test_repeated_calls_do_not_share_arguments(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        yml = tmp_path / "spec.yaml"
+        _write_spec(yml)
+
+        assert main(["run", "--spec", str(yml), "--backend", "mock"]) == 0
+        assert main(["run", "--spec", "/nonexistent/spec.yaml", "--backend", "mock"]) == 1
+        assert "/nonexistent/spec.yaml" in capsys.readouterr().err
+
 
 class TestRunSubcommand:
     def test_run_with_yaml_spec(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
@@ -223,6 +248,131 @@ class TestRunSubcommand:
         assert "Progress:" in out
         assert "a" in out
 
+    def test_run_summary_table_is_aligned(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        yml = tmp_path / "spec.yaml"
+        _write_spec(yml)
+
+        main(["run", "--spec", str(yml), "--backend", "mock"])
+
+        lines = capsys.readouterr().out.splitlines()
+        start = lines.index("Progress:") + 1
+        header, rule, row = lines[start : start + 3]
+        assert header.split() == ["Step", "Spec", "Status", "Attempts", "Summary"]
+        assert rule == "-" * len(header)
+        assert len(row) == len(header)
+        assert row.index("success") == header.index("Status")
+
+    def test_run_summary_truncated_at_word_boundary(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        yml = tmp_path / "spec.yaml"
+        _write_spec(yml)
+        from spec_orca.backends.mock import MockBackend, MockBackendConfig
+
+        backend = MockBackend(config=MockBackendConfig(summary="word " * 20 + "\nend"))
+
+        with mock.patch("spec_orca.backends.create_backend", return_value=backend):
+            main(["run", "--spec", str(yml), "--backend", "mock"])
+
+        row = capsys.readouterr().out.splitlines()[3]
+        assert row.endswith("  " + " ".join(["word"] * 11) + "...")
+
+    @pytest.mark.parametrize(
+        ("summary", "expected"),
+        [
+            ("alpha " * 9 + "in-summaries-that-keep-going", " ".join(["alpha"] * 9) + "..."),
+            ("x" * 80, "x" * 57 + "..."),
+        ],
+    )
+    def test_run_summary_breaks_only_on_whitespace(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        summary: str,
+        expected: str,
+    ) -> None:
+        yml = tmp_path / "spec.yaml"
+        _write_spec(yml)
+        from spec_orca.backends.mock import MockBackend, MockBackendConfig
+
+        backend = MockBackend(config=MockBackendConfig(summary=summary))
+
+        with mock.patch("spec_orca.backends.create_backend", return_value=backend):
+            main(["run", "--spec", str(yml), "--backend", "mock"])
+
+        row = capsys.readouterr().out.splitlines()[3]
+        assert row.endswith("  " + expected)
+
+    def test_run_writes_state_with_history(self, tmp_path: Path) -> None:
+        from spec_orca.state import ProjectState, load_state
+
+        yml = tmp_path / "spec.yaml"
+        _write_spec(yml)
+        state_file = tmp_path / "state.json"
+        base = ProjectState(
+            repo_path=tmp_path,
+            git_head_sha="0" * 40,
+            tracked_files=["spec.yaml"],
+            status_summary="clean",
+            diff_summary="no diffs",
+        )
+
+        with mock.patch("spec_orca.state.build_state", return_value=base):
+            rc = main(["run", "--spec", str(yml), "--backend", "mock", "--state", str(state_file)])
+
+        assert rc == 0
+        saved = load_state(state_file)
+        assert saved.git_head_sha == base.git_head_sha
+        assert saved.tracked_files == ["spec.yaml"]
+        assert [result.summary for result in saved.history] == ["Mock execution of spec 'A'"]
+
+    def test_run_flattens_comma_separated_tools(self, tmp_path: Path) -> None:
+        from spec_orca.backends.mock import MockBackend
+
+        yml = tmp_path / "spec.yaml"
+        _write_spec(yml)
+
+        with mock.patch("spec_orca.backends.create_backend", return_value=MockBackend()) as create:
+            main(
+                [
+                    "run",
+                    "--spec",
+                    str(yml),
+                    "--claude-allowed-tools",
+                    " Read, Write ,",
+                    "--claude-allowed-tools",
+                    ",Edit",
+                ]
+            )
+
+        claude_config = create.call_args.kwargs["claude_config"]
+        assert claude_config.allowed_tools == ["Read", "Write", "Edit"]
+
+    def test_run_backend_settings_precedence(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from spec_orca.backends.mock import MockBackend
+
+        yml = tmp_path / "spec.yaml"
+        _write_spec(yml)
+        (tmp_path / "spec-orca.toml").write_text(
+            "claude_max_turns = 0\nclaude_timeout_seconds = 60\n", encoding="utf-8"
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("CLAUDE_CODE_MAX_TURNS", "7")
+        monkeypatch.setenv("CLAUDE_CODE_MAX_BUDGET_USD", "1.5")
+        monkeypatch.setenv("CLAUDE_CODE_TIMEOUT", "30")
+
+        with mock.patch("spec_orca.backends.create_backend", return_value=MockBackend()) as create:
+            main(["run", "--spec", str(yml), "--claude-timeout-seconds", "90"])
+
+        claude_config = create.call_args.kwargs["claude_config"]
+        assert claude_config.max_turns == 0
+        assert claude_config.max_budget_usd == 1.5
+        assert claude_config.timeout == 90
+
     def test_run_missing_spec(self, capsys: pytest.CaptureFixture[str]) -> None:
         rc = main(["run", "--spec", "/nonexistent/spec.yaml"])
 
@@ -274,6 +424,22 @@ class TestDoctorSubcommand:
         assert "python: OK" in out
         assert "git:" in out
 
+    def test_doctor_git_failure_reports_stderr(self, capsys: pytest.CaptureFixture[str]) -> None:
+        failed = subprocess.CompletedProcess(["git"], 1, stdout=b"", stderr=b"broken git\n")
+        with mock.patch("subprocess.run", return_value=failed):
+            rc = main(["doctor", "--backend", "mock"])
+
+        assert rc == 1
+        assert "git: FAIL - broken git" in capsys.readouterr().out
+
+    def test_doctor_git_timeout_reported(self, capsys: pytest.CaptureFixture[str]) -> None:
+        timeout = subprocess.TimeoutExpired(["git", "--version"], 2)
+        with mock.patch("subprocess.run", side_effect=timeout):
+            rc = main(["doctor", "--backend", "mock"])
+
+        assert rc == 1
+        assert "git: FAIL - git --version timed out" in capsys.readouterr().out
+
     def test_doctor_missing_spec_fails(self, capsys: pytest.CaptureFixture[str]) -> None:
         rc = main(["doctor", "--spec", "/nope/spec.yaml", "--backend", "mock"])
 
@@ -281,6 +447,14 @@ class TestDoctorSubcommand:
         out = capsys.readouterr().out
         assert "spec: FAIL" in out
 
+    def test_doctor_spec_directory_fails(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        rc = main(["doctor", "--spec", str(tmp_path), "--backend", "mock"])
+
+        assert rc == 1
+        assert "spec path is not a file" in capsys.readouterr().out
+
     def test_doctor_backend_missing_executable(
         self,
         capsys: pytest.CaptureFixture[str],
@@ -334,6 +508,43 @@ claude_bin = "custom-claude"
         out = capsys.readouterr().out
         assert "custom-claude" in out
 
+    def test_doctor_reads_claude_table(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        (tmp_path / "spec-orca.toml").write_text(
+            '[claude]\nclaude_bin = "table-claude"\n', encoding="utf-8"
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("CLAUDE_CODE_EXECUTABLE", raising=False)
+        monkeypatch.setattr("shutil.which", lambda value: f"/usr/bin/{value}")
+
+        assert main(["doctor", "--backend", "claude"]) == 0
+        assert "table-claude" in capsys.readouterr().out
+
+    def test_doctor_rereads_edited_config(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        config = tmp_path / "spec-orca.toml"
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("CLAUDE_CODE_EXECUTABLE", raising=False)
+        monkeypatch.setattr("shutil.which", lambda value: f"/usr/bin/{value}")
+
+        config.write_text('claude_bin = "first-claude"\n', encoding="utf-8")
+        assert main(["doctor", "--backend", "claude"]) == 0
+        assert "first-claude" in capsys.readouterr().out
+
+        config.write_text('claude_bin = "second-claude"\n', encoding="utf-8")
+        assert main(["doctor", "--backend", "claude"]) == 0
+        out = capsys.readouterr().out
+        assert "second-claude" in out
+        assert "first-claude" not in out
+
     def test_doctor_cli_bin_overrides_config(
         self,
         tmp_path: Path,
@@ -360,6 +571,37 @@ claude_bin = "config-claude"
         out = capsys.readouterr().out
         assert "cli-claude" in out
 
+    def test_doctor_ignores_malformed_pyproject_without_spec_orca(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        # Deliberate: a broken pyproject.toml that cannot hold spec-orca
+        # settings is not parsed, so it does not fail the config check.
+        (tmp_path / "pyproject.toml").write_text("[project\nname = ", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        main(["doctor", "--backend", "mock"])
+
+        out = capsys.readouterr().out
+        assert "backend: OK - mock backend available" in out
+        assert "Invalid TOML" not in out
+
+    def test_doctor_reports_invalid_spec_orca_pyproject(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        (tmp_path / "pyproject.toml").write_text("[tool.spec_orca\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+
+        rc = main(["doctor", "--backend", "mock"])
+
+        assert rc == 1
+        assert "Invalid TOML in config file" in capsys.readouterr().out
+
     def test_doctor_uses_configured_codex_bin(
         self,
         tmp_path: Path,
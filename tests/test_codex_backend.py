@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import subprocess
+from dataclasses import replace
 from pathlib import Path
+from typing import Any
 from unittest import mock
 
 import pytest
@@ -35,7 +38,7 @@ def _make_context(tmp_path: Path) -> Context:
 @pytest.fixture(autouse=True)
 def _stub_git_delta(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        "spec_orca.backends.codex.compute_status_delta",
+        "spec_orca.backends._common.compute_status_delta",
         lambda *_args, **_kwargs: (GitStatusDelta(changed=[]), None),
     )
 
@@ -45,12 +48,57 @@ def _completed(
     returncode: int = 0,
     stdout: str = "",
     stderr: str = "",
+) -> subprocess.CompletedProcess[bytes]:
+    """Binary-mode result, as captured by ``execute()``."""
+    return subprocess.CompletedProcess(
+        args=[], returncode=returncode, stdout=stdout.encode(), stderr=stderr.encode()
+    )
+
+
+def _completed_text(
+    *,
+    returncode: int = 0,
+    stdout: str = "",
+    stderr: str = "",
 ) -> subprocess.CompletedProcess[str]:
+    """Text-mode result, as captured by ``chat()``."""
     return subprocess.CompletedProcess(
         args=[], returncode=returncode, stdout=stdout, stderr=stderr
     )
 
 
+class _FakeAsyncProcess:
+    def __init__(
+        self,
+        stdout: bytes = b"",
+        stderr: bytes = b"",
+        returncode: int = 0,
+        *,
+        hang: bool = False,
+    ) -> None:
+        self._stdout = stdout
+        self._stderr = stderr
+        self._final_returncode = returncode
+        self._hang = hang
+        self.returncode: int | None = None
+        self.killed = False
+        self.started = asyncio.Event()
+
+    async def communicate(self) -> tuple[bytes, bytes]:
+        self.started.set()
+        if self._hang:
+            await asyncio.Event().wait()
+        self.returncode = self._final_returncode
+        return self._stdout, self._stderr
+
+    def kill(self) -> None:
+        self.killed = True
+
+    async def wait(self) -> int:
+        self.returncode = -9
+        return self.returncode
+
+
 def test_success_with_json_response(tmp_path: Path) -> None:
     backend = CodexBackend(CodexConfig(executable="codex"))
     response = {
@@ -75,6 +123,59 @@ def test_success_with_json_response(tmp_path: Path) -> None:
     assert result.structured_output is not None
 
 
+def test_git_status_skipped_when_not_tracked(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex"))
+    delta = mock.Mock(return_value=(GitStatusDelta(changed=["a.py"]), None))
+    monkeypatch.setattr("spec_orca.backends._common.compute_status_delta", delta)
+    payload = json.dumps({"result": "ok"})
+    context = replace(_make_context(tmp_path), track_git_status=False)
+
+    with (
+        mock.patch("shutil.which", return_value="/usr/bin/codex"),
+        mock.patch("subprocess.run", return_value=_completed(stdout=payload)),
+    ):
+        result = backend.execute(_make_spec(), context)
+
+    assert result.status == ResultStatus.SUCCESS
+    assert result.files_changed == []
+    delta.assert_not_called()
+
+
+def test_git_status_not_retried_after_failed_snapshot(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex"))
+    delta = mock.Mock(return_value=(GitStatusDelta(changed=[]), "not a git repository"))
+    monkeypatch.setattr("spec_orca.backends._common.compute_status_delta", delta)
+    payload = json.dumps({"status": "success", "summary": "Done."})
+
+    with (
+        mock.patch("shutil.which", return_value="/usr/bin/codex"),
+        mock.patch("subprocess.run", return_value=_completed(stdout=payload)),
+    ):
+        result = backend.execute(_make_spec(), _make_context(tmp_path))
+
+    assert result.files_changed == []
+    assert "Git status unavailable: not a git repository" in result.details
+    delta.assert_called_once()
+
+
+def test_status_is_normalized(tmp_path: Path) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex"))
+    payload = json.dumps({"status": " Failure ", "summary": "Tests failed."})
+
+    with (
+        mock.patch("shutil.which", return_value="/usr/bin/codex"),
+        mock.patch("subprocess.run", return_value=_completed(stdout=payload)),
+    ):
+        result = backend.execute(_make_spec(), _make_context(tmp_path))
+
+    assert result.status == ResultStatus.FAILURE
+    assert result.summary == "Tests failed."
+
+
 def test_success_with_plain_text_response(tmp_path: Path) -> None:
     backend = CodexBackend(CodexConfig(executable="codex"))
     payload = json.dumps({"result": "Implemented successfully"})
@@ -90,6 +191,21 @@ def test_success_with_plain_text_response(tmp_path: Path) -> None:
     assert result.structured_output is None
 
 
+def test_undecodable_output_is_replaced(tmp_path: Path) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex"))
+    proc = subprocess.CompletedProcess(args=[], returncode=0, stdout=b"done \xff\n", stderr=b"")
+
+    with (
+        mock.patch("shutil.which", return_value="/usr/bin/codex"),
+        mock.patch("subprocess.run", return_value=proc) as mocked_run,
+    ):
+        result = backend.execute(_make_spec(), _make_context(tmp_path))
+
+    assert "text" not in mocked_run.call_args.kwargs
+    assert result.status == ResultStatus.SUCCESS
+    assert result.summary == "done \ufffd"
+
+
 def test_non_zero_exit_returns_failure(tmp_path: Path) -> None:
     backend = CodexBackend(CodexConfig(executable="codex"))
 
@@ -134,11 +250,42 @@ def test_command_includes_exec_full_auto_and_json(tmp_path: Path) -> None:
 
     cmd = mocked_run.call_args[0][0]
     assert cmd[:4] == ["/usr/bin/codex", "exec", "--full-auto", "--json"]
-    assert "--model" in cmd
+    assert cmd[4:8] == ["--model", "gpt-5-codex", "-c", "model_reasoning_effort=high"]
+    assert cmd[8].startswith("You are implementing a spec")
     assert "-q" not in cmd
     assert mocked_run.call_args.kwargs["cwd"] == _make_context(tmp_path).repo_path
 
 
+def test_prompt_omits_schema_instruction(tmp_path: Path) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex"))
+    payload = json.dumps({"result": "ok"})
+
+    with (
+        mock.patch("shutil.which", return_value="/usr/bin/codex"),
+        mock.patch("subprocess.run", return_value=_completed(stdout=payload)) as mocked_run,
+    ):
+        backend.execute(_make_spec(), _make_context(tmp_path))
+
+    prompt = mocked_run.call_args[0][0][-1]
+    assert "- Run codex in JSON mode." in prompt
+    assert "JSON Schema" not in prompt
+    assert prompt.endswith(
+        "- If acceptance criteria mention tests or linting, run the relevant checks."
+    )
+
+
+def test_settings_read_from_environment(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("CODEX_EXECUTABLE", " /opt/codex ")
+    monkeypatch.setenv("CODEX_TIMEOUT", "45")
+    monkeypatch.setenv("CODEX_MODEL", "   ")
+
+    backend = CodexBackend()
+
+    assert backend._executable == "/opt/codex"
+    assert backend._timeout == 45
+    assert backend._model is None
+
+
 def test_missing_executable_returns_failure(tmp_path: Path) -> None:
     backend = CodexBackend(CodexConfig(executable="missing-codex"))
 
@@ -149,6 +296,19 @@ def test_missing_executable_returns_failure(tmp_path: Path) -> None:
     assert "CODEX_EXECUTABLE" in (result.error or "")
 
 
+def test_missing_executable_skips_git_status(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    backend = CodexBackend(CodexConfig(executable="missing-codex"))
+    delta = mock.Mock(return_value=(GitStatusDelta(changed=[]), None))
+    monkeypatch.setattr("spec_orca.backends._common.compute_status_delta", delta)
+
+    with mock.patch("shutil.which", return_value=None):
+        backend.execute(_make_spec(), _make_context(tmp_path))
+
+    delta.assert_not_called()
+
+
 def test_chat_returns_text(tmp_path: Path) -> None:
     backend = CodexBackend(CodexConfig(executable="codex"))
 
@@ -156,7 +316,7 @@ def test_chat_returns_text(tmp_path: Path) -> None:
         mock.patch("shutil.which", return_value="/usr/bin/codex"),
         mock.patch(
             "subprocess.run",
-            return_value=_completed(stdout="  Conversational reply  "),
+            return_value=_completed_text(stdout="  Conversational reply  "),
         ),
     ):
         result = backend.chat("hello", cwd=tmp_path)
@@ -164,6 +324,20 @@ def test_chat_returns_text(tmp_path: Path) -> None:
     assert result == "Conversational reply"
 
 
+def test_executable_lookup_cached_after_success(tmp_path: Path) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex"))
+
+    with (
+        mock.patch("shutil.which", side_effect=[None, "/usr/bin/codex"]) as mock_which,
+        mock.patch("subprocess.run", return_value=_completed_text(stdout="ok")),
+    ):
+        assert backend.chat("hi", cwd=tmp_path).startswith("Error:")
+        assert backend.chat("hi", cwd=tmp_path) == "ok"
+        assert backend.chat("hi", cwd=tmp_path) == "ok"
+
+    assert mock_which.call_count == 2
+
+
 def test_chat_no_json_flag(tmp_path: Path) -> None:
     backend = CodexBackend(CodexConfig(executable="codex"))
 
@@ -171,7 +345,7 @@ def test_chat_no_json_flag(tmp_path: Path) -> None:
         mock.patch("shutil.which", return_value="/usr/bin/codex"),
         mock.patch(
             "subprocess.run",
-            return_value=_completed(stdout="ok"),
+            return_value=_completed_text(stdout="ok"),
         ) as mocked_run,
     ):
         backend.chat("hello", cwd=tmp_path)
@@ -241,3 +415,87 @@ def test_success_with_jsonl_event_stream(tmp_path: Path) -> None:
 
     assert result.status == ResultStatus.SUCCESS
     assert result.summary == "From event stream."
+
+
+@pytest.mark.parametrize(
+    ("stdout", "summary"),
+    [
+        (b'{"result": "caf\xe9 done"}', "caf\ufffd done"),
+        (
+            b'{"type": "session.started"}\n'
+            b'{"type": "item.completed",'
+            b' "item": {"type": "agent_message", "text": "caf\xff done"}}',
+            "caf\ufffd done",
+        ),
+    ],
+)
+def test_invalid_utf8_in_output_is_replaced(tmp_path: Path, stdout: bytes, summary: str) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex"))
+    proc = subprocess.CompletedProcess(args=[], returncode=0, stdout=stdout, stderr=b"")
+
+    with (
+        mock.patch("shutil.which", return_value="/usr/bin/codex"),
+        mock.patch("subprocess.run", return_value=proc),
+    ):
+        result = backend.execute(_make_spec(), _make_context(tmp_path))
+
+    assert result.status == ResultStatus.SUCCESS
+    assert result.summary == summary
+
+
+def test_execute_async_json_response(tmp_path: Path) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex"))
+    payload = json.dumps({"status": "partial", "summary": "Async half done."})
+    fake_proc = _FakeAsyncProcess(stdout=payload.encode())
+
+    with (
+        mock.patch("shutil.which", return_value="/usr/bin/codex"),
+        mock.patch("asyncio.create_subprocess_exec", return_value=fake_proc) as mock_exec,
+    ):
+        result = asyncio.run(backend.execute_async(_make_spec(), _make_context(tmp_path)))
+
+    assert result.status == ResultStatus.PARTIAL
+    assert result.summary == "Async half done."
+    assert mock_exec.call_args.args[:4] == ("/usr/bin/codex", "exec", "--full-auto", "--json")
+    assert mock_exec.call_args.kwargs["cwd"] == tmp_path
+
+
+def test_execute_async_timeout_kills_process(tmp_path: Path) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex", timeout=5))
+    fake_proc = _FakeAsyncProcess()
+
+    async def _raise_timeout(awaitable: Any, **_kwargs: object) -> object:
+        awaitable.close()
+        raise TimeoutError
+
+    with (
+        mock.patch("shutil.which", return_value="/usr/bin/codex"),
+        mock.patch("asyncio.create_subprocess_exec", return_value=fake_proc),
+        mock.patch("asyncio.wait_for", side_effect=_raise_timeout),
+    ):
+        result = asyncio.run(backend.execute_async(_make_spec(), _make_context(tmp_path)))
+
+    assert result.status == ResultStatus.FAILURE
+    assert "timed out" in (result.error or "").lower()
+    assert fake_proc.killed
+
+
+def test_execute_async_cancel_kills_process(tmp_path: Path) -> None:
+    backend = CodexBackend(CodexConfig(executable="codex"))
+    fake_proc = _FakeAsyncProcess(hang=True)
+
+    async def _cancel_while_running() -> None:
+        task = asyncio.create_task(backend.execute_async(_make_spec(), _make_context(tmp_path)))
+        await fake_proc.started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with (
+        mock.patch("shutil.which", return_value="/usr/bin/codex"),
+        mock.patch("asyncio.create_subprocess_exec", return_value=fake_proc),
+    ):
+        asyncio.run(_cancel_while_running())
+
+    assert fake_proc.killed
+    assert fake_proc.returncode == -9
@@ -86,6 +86,9 @@ class TestSpec:
         with pytest.raises(dataclasses.FrozenInstanceError):
             spec.title = "changed"  # type: ignore[misc]
 
+    def test_slotted(self) -> None:
+        assert not hasattr(_make_spec(), "__dict__")
+
     def test_auto_generated_id(self) -> None:
         spec = _make_spec()
         assert isinstance(spec.id, str)
@@ -257,6 +260,7 @@ class TestContext:
         )
         assert ctx.step == 0
         assert ctx.max_steps == 1
+        assert ctx.track_git_status is True
 
     def test_auto_generated_run_id(self) -> None:
         ctx = Context(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 from pathlib import Path
 
 import pytest
@@ -81,6 +83,116 @@ specs:
         assert backend.calls == ["a", "b", "c"]
         assert summary.completed == 3
 
+    def test_out_of_order_input_prefers_original_index(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "c"
+    title: "C"
+    acceptance_criteria: ["done"]
+    dependencies: ["a"]
+  - id: "a"
+    title: "A"
+    acceptance_criteria: ["done"]
+  - id: "b"
+    title: "B"
+    acceptance_criteria: ["done"]
+""",
+        )
+
+        architect = SimpleArchitect(spec_path)
+
+        assert [spec.id for spec in architect.specs] == ["a", "c", "b"]
+
+    def test_runnable_specs_track_completed_dependencies(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "a"
+    title: "A"
+    acceptance_criteria: ["done"]
+  - id: "b"
+    title: "B"
+    acceptance_criteria: ["done"]
+    dependencies: ["a"]
+  - id: "c"
+    title: "C"
+    acceptance_criteria: ["done"]
+    dependencies: ["a"]
+  - id: "d"
+    title: "D"
+    acceptance_criteria: ["done"]
+    dependencies: ["b", "c"]
+""",
+        )
+        architect = SimpleArchitect(spec_path)
+        success = Result(status=ResultStatus.SUCCESS, summary="ok")
+
+        assert [spec.id for spec in architect.runnable_specs()] == ["a"]
+        architect.mark_in_progress("a")
+        assert architect.runnable_specs() == []
+        architect.record_result("a", success)
+        assert [spec.id for spec in architect.runnable_specs()] == ["b", "c"]
+        architect.mark_in_progress("c")
+        architect.record_result("c", success)
+        assert [spec.id for spec in architect.runnable_specs()] == ["b"]
+        with pytest.raises(ValueError, match="Dependencies not satisfied"):
+            architect.mark_in_progress("d")
+        architect.mark_in_progress("b")
+        architect.record_result("b", success)
+        assert [spec.id for spec in architect.runnable_specs()] == ["d"]
+
+    def test_failure_after_done_blocks_dependents_again(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "a"
+    title: "A"
+    acceptance_criteria: ["done"]
+  - id: "b"
+    title: "B"
+    acceptance_criteria: ["done"]
+    dependencies: ["a"]
+""",
+        )
+        architect = SimpleArchitect(spec_path, max_attempts=3)
+        architect.mark_in_progress("a")
+        architect.record_result("a", Result(status=ResultStatus.SUCCESS, summary="ok"))
+        assert [spec.id for spec in architect.runnable_specs()] == ["b"]
+
+        architect.record_result("a", Result(status=ResultStatus.FAILURE, summary="regressed"))
+
+        assert [spec.id for spec in architect.runnable_specs()] == ["a"]
+        with pytest.raises(ValueError, match="Dependencies not satisfied"):
+            architect.mark_in_progress("b")
+        architect.mark_in_progress("a")
+        architect.record_result("a", Result(status=ResultStatus.SUCCESS, summary="ok"))
+        assert [spec.id for spec in architect.runnable_specs()] == ["b"]
+
+    def test_specs_snapshot_reused_until_update(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "a"
+    title: "A"
+    acceptance_criteria: ["done"]
+""",
+        )
+        architect = SimpleArchitect(spec_path)
+
+        before = architect.specs
+        assert architect.specs is before
+        architect.mark_in_progress("a")
+        after = architect.specs
+
+        assert after is not before
+        assert before[0].status == SpecStatus.PENDING
+        assert after[0].status == SpecStatus.IN_PROGRESS
+
     def test_unmet_dependency_not_executed(self, tmp_path: Path) -> None:
         spec_path = _write_spec(
             tmp_path,
@@ -198,3 +310,84 @@ specs:
         spec = summary.specs[0]
         assert spec.attempts == 2
         assert spec.status == SpecStatus.DONE
+
+    def test_status_updates_preserve_other_fields(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "a"
+    title: "A"
+    description: "Do A"
+    acceptance_criteria: ["done"]
+""",
+        )
+        architect = SimpleArchitect(spec_path)
+        original = architect.specs[0]
+
+        running = architect.mark_in_progress("a")
+        finished = architect.record_result("a", Result(status=ResultStatus.SUCCESS, summary="ok"))
+
+        for updated in (running, finished):
+            assert (
+                dataclasses.replace(updated, status=original.status, attempts=original.attempts)
+                == original
+            )
+        assert finished.attempts == 1
+
+
+class RaisingBackend:
+    def execute(self, spec, context):  # type: ignore[no-untyped-def]
+        if spec.id == "boom":
+            raise RuntimeError("backend exploded")
+        return Result(status=ResultStatus.SUCCESS, summary=spec.id)
+
+
+class TestRunBatch:
+    def test_results_follow_input_order(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "a"
+    title: "A"
+    acceptance_criteria: ["done"]
+  - id: "b"
+    title: "B"
+    acceptance_criteria: ["done"]
+""",
+        )
+        backend = RecordingBackend(outcomes={"b": ResultStatus.FAILURE})
+        architect = SimpleArchitect(spec_path)
+        agent = Agent(backend)
+
+        results = asyncio.run(
+            agent.run_batch(architect.runnable_specs(), _make_context(tmp_path, spec_path))
+        )
+
+        assert sorted(backend.calls) == ["a", "b"]
+        assert [result.summary for result in results] == ["a:success", "b:failure"]
+
+    def test_exception_reported_as_error_result(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "boom"
+    title: "Boom"
+    acceptance_criteria: ["done"]
+  - id: "ok"
+    title: "OK"
+    acceptance_criteria: ["done"]
+""",
+        )
+        architect = SimpleArchitect(spec_path)
+        agent = Agent(RaisingBackend())
+
+        results = asyncio.run(
+            agent.run_batch(architect.runnable_specs(), _make_context(tmp_path, spec_path))
+        )
+
+        assert results[0].status == ResultStatus.ERROR
+        assert results[0].error == "backend exploded"
+        assert results[1].status == ResultStatus.SUCCESS
@@ -0,0 +1,205 @@
+"""Tests for the parallel spec runner."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from spec_orca.agent import Agent
+from spec_orca.architect import SimpleArchitect
+from spec_orca.models import Context, Result, ResultStatus, SpecStatus
+from spec_orca.runner import run_ready_parallel
+
+_DIAMOND = """goal: "test"
+specs:
+  - id: "a"
+    title: "A"
+    acceptance_criteria: ["done"]
+  - id: "b"
+    title: "B"
+    acceptance_criteria: ["done"]
+    dependencies: ["a"]
+  - id: "c"
+    title: "C"
+    acceptance_criteria: ["done"]
+    dependencies: ["a"]
+  - id: "d"
+    title: "D"
+    acceptance_criteria: ["done"]
+    dependencies: ["b", "c"]
+"""
+
+
+def _write_spec(tmp_path: Path, content: str = _DIAMOND) -> Path:
+    path = tmp_path / "specs.yaml"
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def _make_context(tmp_path: Path, spec_path: Path) -> Context:
+    return Context(
+        repo_path=tmp_path,
+        spec_path=spec_path,
+        goal="test",
+        backend_name="mock",
+        track_git_status=False,
+    )
+
+
+class BarrierBackend:
+    """Backend whose 'b' and 'c' specs only succeed if they run concurrently."""
+
+    def __init__(self, outcomes: dict[str, ResultStatus] | None = None) -> None:
+        self.calls: list[str] = []
+        self._outcomes = outcomes or {}
+        self._barrier = threading.Barrier(2, timeout=5)
+        self._lock = threading.Lock()
+
+    def execute(self, spec, context):  # type: ignore[no-untyped-def]
+        with self._lock:
+            self.calls.append(spec.id)
+        if spec.id in {"b", "c"}:
+            self._barrier.wait()
+        if spec.id == "boom":
+            raise RuntimeError("backend exploded")
+        status = self._outcomes.get(spec.id, ResultStatus.SUCCESS)
+        return Result(status=status, summary=f"{spec.id}:{status.value}")
+
+
+class TestRunReadyParallel:
+    def test_independent_specs_run_concurrently(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(tmp_path)
+        architect = SimpleArchitect(spec_path)
+        backend = BarrierBackend()
+
+        steps = run_ready_parallel(
+            architect, Agent(backend), _make_context(tmp_path, spec_path), max_workers=2
+        )
+
+        assert [step.result.status for step in steps] == [ResultStatus.SUCCESS] * 4
+        assert backend.calls[0] == "a"
+        assert sorted(backend.calls[1:3]) == ["b", "c"]
+        assert backend.calls[3] == "d"
+        assert [step.index for step in steps] == [0, 1, 2, 3]
+        assert all(spec.status == SpecStatus.DONE for spec in architect.specs)
+
+    def test_stop_on_failure_blocks_new_dispatches(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "x"
+    title: "X"
+    acceptance_criteria: ["done"]
+  - id: "y"
+    title: "Y"
+    acceptance_criteria: ["done"]
+""",
+        )
+        architect = SimpleArchitect(spec_path)
+        backend = BarrierBackend(outcomes={"x": ResultStatus.FAILURE})
+
+        steps = run_ready_parallel(
+            architect, Agent(backend), _make_context(tmp_path, spec_path), max_workers=1
+        )
+
+        assert [step.spec_id for step in steps] == ["x"]
+        assert backend.calls == ["x"]
+
+    def test_continue_on_failure_runs_remaining_specs(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(tmp_path)
+        architect = SimpleArchitect(spec_path)
+        backend = BarrierBackend(outcomes={"b": ResultStatus.FAILURE})
+
+        steps = run_ready_parallel(
+            architect,
+            Agent(backend),
+            _make_context(tmp_path, spec_path),
+            max_workers=2,
+            stop_on_failure=False,
+        )
+
+        assert sorted(step.spec_id for step in steps) == ["a", "b", "c"]
+        assert "d" not in backend.calls
+
+    def test_max_steps_limits_dispatches(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(tmp_path)
+        architect = SimpleArchitect(spec_path)
+        backend = BarrierBackend()
+
+        steps = run_ready_parallel(
+            architect,
+            Agent(backend),
+            _make_context(tmp_path, spec_path),
+            max_workers=2,
+            max_steps=1,
+        )
+
+        assert [step.spec_id for step in steps] == ["a"]
+
+    def test_exception_recorded_as_error(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "boom"
+    title: "Boom"
+    acceptance_criteria: ["done"]
+""",
+        )
+        architect = SimpleArchitect(spec_path)
+
+        steps = run_ready_parallel(
+            architect, Agent(BarrierBackend()), _make_context(tmp_path, spec_path)
+        )
+
+        assert steps[0].result.status == ResultStatus.ERROR
+        assert steps[0].result.error == "backend exploded"
+        assert architect.specs[0].status == SpecStatus.FAILED
+
+    def test_rejects_non_positive_workers(self, tmp_path: Path) -> None:
+        spec_path = _write_spec(tmp_path)
+        architect = SimpleArchitect(spec_path)
+
+        with pytest.raises(ValueError, match="max_workers"):
+            run_ready_parallel(
+                architect,
+                Agent(BarrierBackend()),
+                _make_context(tmp_path, spec_path),
+                max_workers=0,
+            )
+
+    @pytest.mark.parametrize(("max_workers", "tracked"), [(1, True), (2, False)])
+    def test_git_status_tracking_disabled_when_concurrent(
+        self, tmp_path: Path, max_workers: int, tracked: bool
+    ) -> None:
+        spec_path = _write_spec(
+            tmp_path,
+            """goal: "test"
+specs:
+  - id: "x"
+    title: "X"
+    acceptance_criteria: ["done"]
+""",
+        )
+        seen: list[bool] = []
+
+        class RecordingBackend:
+            def execute(self, spec, context):  # type: ignore[no-untyped-def]
+                seen.append(context.track_git_status)
+                return Result(status=ResultStatus.SUCCESS, summary="ok")
+
+        context = Context(
+            repo_path=tmp_path, spec_path=spec_path, goal="test", backend_name="mock"
+        )
+
+        run_ready_parallel(
+            SimpleArchitect(spec_path),
+            Agent(RecordingBackend()),
+            context,
+            max_workers=max_workers,
+        )
+
+        assert seen == [tracked]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+import json
 import subprocess
 from pathlib import Path
 
@@ -46,6 +48,40 @@ def _init_repo(tmp_path: Path) -> Path:
     return repo
 
 
+def _make_state(repo_path: Path, history: list[Result] | None = None) -> ProjectState:
+    return ProjectState(
+        repo_path=repo_path,
+        git_head_sha="0" * 40,
+        tracked_files=["README.md"],
+        status_summary="clean",
+        diff_summary="no diffs",
+        history=history or [],
+    )
+
+
+class TestSaveState:
+    def test_persists_every_field(self, tmp_path: Path) -> None:
+        path = save_state(_make_state(tmp_path))
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+
+        assert set(data) == {item.name for item in dataclasses.fields(ProjectState)}
+
+    def test_unserialisable_state_keeps_previous_file(self, tmp_path: Path) -> None:
+        path = save_state(_make_state(tmp_path))
+        before = path.read_text(encoding="utf-8")
+        bad = Result(
+            status=ResultStatus.SUCCESS,
+            summary="ok",
+            structured_output={"value": object()},
+        )
+
+        with pytest.raises(TypeError):
+            save_state(_make_state(tmp_path, [bad]))
+
+        assert path.read_text(encoding="utf-8") == before
+
+
 @pytest.mark.skipif(not _git_available(), reason="git not available")
 class TestProjectState:
     def test_build_state_clean_repo(self, tmp_path: Path) -> None: